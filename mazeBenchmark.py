@@ -0,0 +1,279 @@
+"""
+Benchmark harness for the maze solvers.
+
+Runs every solver headlessly over the maps in ``save/`` and over generated
+perfect, braided and open mazes of increasing size, and writes wall time,
+explored states per second, path length, the solver's ``SolveStats``
+counters and tracemalloc peak to a JSON file. A later run can be compared
+against it to catch regressions.
+
+Examples:
+    python -m mazeBenchmark run --output before.json
+    python -m mazeBenchmark run --output after.json --compare before.json
+    python -m mazeBenchmark compare before.json after.json --threshold 0.15
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import mazeEngine
+import mazeFormat
+import randomMaze
+
+BENCHMARK_VERSION = 1
+
+DEFAULT_SIZES = (16, 32, 64, 128)
+TOPOLOGIES = ("perfect", "braided", "open")
+DEFAULT_MAPS = os.path.join("save", "*")
+
+# Wall time differences below this many seconds are noise, whatever the ratio
+MIN_TIME_DELTA = 0.002
+
+
+def open_maze(width, height, seed):
+    """A walled room with no inner walls and a random start and goal: the worst case for the uninformed searches."""
+    rng = random.Random(seed)
+    (start_x, start_y), (goal_x, goal_y) = randomMaze.pick_endpoints(2 * width - 1, 2 * height - 1, rng)
+    rows = [[" "] * (2 * width - 1) for _ in range(2 * height - 1)]
+    rows[start_y][start_x] = "A"
+    rows[goal_y][goal_x] = "B"
+    border = "#" * (2 * width + 1)
+    return mazeEngine.Maze.from_text("\n".join([border] + ["#" + "".join(row) + "#" for row in rows] + [border]))
+
+
+def benchmark_mazes(map_pattern=DEFAULT_MAPS, sizes=DEFAULT_SIZES, topologies=TOPOLOGIES, seed=0):
+    """Yield (name, topology, maze) for every benchmark input, in a stable order."""
+    for filename in sorted(glob.glob(map_pattern)):
+        if filename.endswith((".txt", mazeFormat.BINARY_EXTENSION)):
+            yield filename, "map", mazeEngine.Maze(filename)
+
+    for size in sizes:
+        for topology in topologies:
+            maze_seed = randomMaze.derive_seed(seed, f"{topology}:{size}")
+            if topology == "open":
+                maze = open_maze(size, size, maze_seed)
+            else:
+                maze = randomMaze.generate(size, size, maze_seed, topology)
+            yield f"{topology}-{size}x{size}", topology, maze
+
+
+def measure(maze, algorithm, repeat=3, beam_width=2):
+    """
+    Solve ``repeat`` times for timing, then once more under tracemalloc for
+    the memory peak. Cached fields are dropped before every run so each one
+    pays for the heuristic and graph tables it builds.
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    times = []
+    for _ in range(repeat):
+        maze.invalidate_caches()
+        result = mazeEngine.solve(maze, algorithm, beam_width=beam_width)
+        times.append(result["wall_time"])
+
+    maze.invalidate_caches()
+    tracemalloc.start()
+    try:
+        mazeEngine.solve(maze, algorithm, beam_width=beam_width)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    wall_time = min(times)
+    measured = {
+        "solved": result["solved"],
+        "path_length": result["path_length"],
+        "explored": result["explored"],
+        "generated": result["generated"],
+        "pushes": result["pushes"],
+        "duplicates": result["duplicates"],
+        "peak_frontier": result["peak_frontier"],
+        "peak_explored": result["peak_explored"],
+        "wall_time": wall_time,
+        "wall_time_median": statistics.median(times),
+        "explored_per_second": result["explored"] / wall_time if wall_time else None,
+        "peak_memory": peak_memory,
+    }
+    if "error" in result:
+        measured["error"] = result["error"]
+    return measured
+
+
+def _measure_worker(connection, maze, algorithm, repeat, beam_width):
+    try:
+        connection.send(measure(maze, algorithm, repeat, beam_width))
+    except Exception as e:
+        connection.send({"solved": False, "error": f"{type(e).__name__}: {e}"})
+    finally:
+        connection.close()
+
+
+def measure_isolated(maze, algorithm, repeat=3, beam_width=2, timeout=30.0):
+    """
+    Run ``measure`` in a child process so a solver that blows up on a maze
+    (the plain BFS on open rooms, say) is stopped after ``timeout`` seconds
+    instead of stalling the whole suite.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_measure_worker, args=(sender, maze, algorithm, repeat, beam_width), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        return {"solved": False, "error": f"timed out after {timeout:g}s", "timeout": True}
+    except EOFError:
+        return {"solved": False, "error": f"worker died with exit code {process.exitcode}"}
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+
+
+def run_benchmarks(algorithms, mazes, repeat=3, beam_width=2, timeout=30.0, log=sys.stderr):
+    """Measure every algorithm on every maze and return the results document."""
+    results = []
+    for name, topology, maze in mazes:
+        for algorithm in algorithms:
+            measured = measure_isolated(maze, algorithm, repeat, beam_width, timeout)
+            results.append({
+                "maze": name,
+                "topology": topology,
+                "width": maze.width,
+                "height": maze.height,
+                "algorithm": algorithm,
+                **measured,
+            })
+            if log is not None:
+                if "wall_time" in measured:
+                    summary = f"{measured['wall_time'] * 1000:9.2f} ms  explored {measured['explored']}"
+                else:
+                    summary = measured["error"]
+                print(f"{name:<24} {algorithm:<20} {summary}", file=log)
+
+    return {
+        "version": BENCHMARK_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": mazeEngine.np is not None,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(old, new, threshold=0.10):
+    """
+    Compare two results documents case by case. Returns two lists of
+    (maze, algorithm, message): regressions, which are wall time or
+    tracemalloc peak more than ``threshold`` worse, a case that stopped
+    solving, more states explored, or a longer path from a solver in
+    ``mazeEngine.SHORTEST_PATH_ALGORITHMS``; and changes, which are other
+    differences in path length or explored count, such as an optimization
+    exploring fewer states or a heuristic solver finding another path,
+    reported for information only.
+    """
+    old_cases = {(result["maze"], result["algorithm"]): result for result in old["results"]}
+    regressions = []
+    changes = []
+    for result in new["results"]:
+        key = (result["maze"], result["algorithm"])
+        before = old_cases.get(key)
+        if before is None:
+            continue
+
+        if before.get("solved") and not result.get("solved"):
+            regressions.append((*key, f"no longer solves: {result.get('error')}"))
+            continue
+        if "wall_time" not in before or "wall_time" not in result:
+            continue
+
+        if result["wall_time"] > before["wall_time"] * (1 + threshold) and result["wall_time"] - before["wall_time"] > MIN_TIME_DELTA:
+            regressions.append((*key, f"wall time {before['wall_time'] * 1000:.2f} -> {result['wall_time'] * 1000:.2f} ms"))
+        if result["peak_memory"] > before["peak_memory"] * (1 + threshold):
+            regressions.append((*key, f"peak memory {before['peak_memory']} -> {result['peak_memory']} bytes"))
+        if result["explored"] > before["explored"]:
+            regressions.append((*key, f"explored increased {before['explored']} -> {result['explored']}"))
+        elif result["explored"] != before["explored"]:
+            changes.append((*key, f"explored changed {before['explored']} -> {result['explored']}"))
+        if (
+            result["algorithm"] in mazeEngine.SHORTEST_PATH_ALGORITHMS
+            and None not in (result["path_length"], before["path_length"])
+            and result["path_length"] > before["path_length"]
+        ):
+            regressions.append((*key, f"path_length increased {before['path_length']} -> {result['path_length']}"))
+        elif result["path_length"] != before["path_length"]:
+            changes.append((*key, f"path_length changed {before['path_length']} -> {result['path_length']}"))
+    return regressions, changes
+
+
+def report(regressions, changes=(), out=sys.stdout):
+    for maze, algorithm, message in changes:
+        print(f"CHANGED    {maze:<24} {algorithm:<20} {message}", file=out)
+    for maze, algorithm, message in regressions:
+        print(f"REGRESSION {maze:<24} {algorithm:<20} {message}", file=out)
+    print(f"{len(regressions)} regression(s), {len(changes)} other change(s)", file=out)
+    return 1 if regressions else 0
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="mazeBenchmark", description="Benchmark the maze solvers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark suite and write JSON results")
+    run_parser.add_argument("--algo", nargs="+", default=sorted(mazeEngine.ALGORITHMS), choices=sorted(mazeEngine.ALGORITHMS), help="Algorithms to run (default: all)")
+    run_parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Generated maze sizes, in cells per side")
+    run_parser.add_argument("--topologies", nargs="+", default=list(TOPOLOGIES), choices=TOPOLOGIES, help="Generated maze topologies")
+    run_parser.add_argument("--maps", default=DEFAULT_MAPS, help="Glob of saved maps to include (default: save/*)")
+    run_parser.add_argument("--seed", type=int, default=0, help="Master seed for the generated mazes")
+    run_parser.add_argument("--repeat", type=_positive_int, default=3, help="Timed runs per case; the fastest is reported")
+    run_parser.add_argument("--timeout", type=float, default=30.0, help="Seconds before a case is abandoned")
+    run_parser.add_argument("--beam-width", type=int, default=2, help="Beam width for beam search")
+    run_parser.add_argument("--output", default="benchmark.json", help="JSON results file")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="Compare against an earlier results file")
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("baseline", help="Earlier results file")
+    compare_parser.add_argument("current", help="Later results file")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            old = json.load(f)
+        with open(args.current) as f:
+            new = json.load(f)
+        return report(*compare(old, new, args.threshold))
+
+    mazes = benchmark_mazes(args.maps, args.sizes, args.topologies, args.seed)
+    document = run_benchmarks(args.algo, mazes, args.repeat, args.beam_width, args.timeout)
+    with open(args.output, "w") as f:
+        json.dump(document, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            return report(*compare(json.load(f), document, args.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1353 @@
+"""
+Headless maze engine: maze parsing and the search algorithms, with no tkinter
+dependency, so solvers can run on display-less machines.
+"""
+import functools
+import hashlib
+import json
+import math
+import re
+import time
+from array import array
+import heapq
+
+import mazeFormat
+import mazeFrontier
+import mazeProfiler
+import solveCache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the wavefront BFS falls back to big-int bitboards
+    np = None
+
+
+# Maps the algorithm names used by the headless API and CLI to Maze methods
+ALGORITHMS = {
+    "bfs": "bfs_solve",
+    "bfs-wavefront": "bfs_wavefront_solve",
+    "dfs": "dfs_solve",
+    "astar": "a_star_solve",
+    "astar-optimal": "a_star_optimal_solve",
+    "astar-exact": "a_star_exact_solve",
+    "bfs-bidirectional": "bidirectional_bfs_solve",
+    "astar-bidirectional": "bidirectional_a_star_solve",
+    "jps": "jump_point_solve",
+    "contracted": "contracted_solve",
+    "greedy": "greedy_solve",
+    "hillclimb": "hill_climb_solve",
+    "beam": "beam_search_solve",
+}
+_ALGORITHM_NAMES = {method: name for name, method in ALGORITHMS.items()}
+
+# Algorithms that always return a shortest path; the others trade path length for speed
+SHORTEST_PATH_ALGORITHMS = frozenset({
+    "bfs", "bfs-wavefront", "astar-optimal", "astar-exact", "bfs-bidirectional", "astar-bidirectional", "jps",
+    "contracted",
+})
+
+
+class SolveStats:
+    """
+    What one solver run did, filled in by every solver.
+
+    ``expansions`` counts states taken off the frontier and expanded,
+    ``generated`` the successors those expansions produced, ``pushes`` the
+    successors added to the frontier and ``duplicates`` the successors dropped
+    because their state was already explored or reached as cheaply, plus
+    stale heap entries skipped on pop. ``peak_frontier`` is the largest
+    open list held and ``peak_explored`` the size of the explored set at the
+    end (it never shrinks). ``visualize_time`` is the part of ``wall_time``
+    spent in the visualize callback; ``search_time`` is the rest.
+    """
+
+    FIELDS = (
+        "algorithm", "solved", "path_length", "expansions", "generated", "pushes", "duplicates",
+        "peak_frontier", "peak_explored", "wall_time", "visualize_time", "search_time",
+    )
+
+    def __init__(self, algorithm=None):
+        self.algorithm = algorithm
+        self.solved = False
+        self.path_length = None
+        self.error = None
+        self.expansions = 0
+        self.generated = 0
+        self.pushes = 0
+        self.duplicates = 0
+        self.peak_frontier = 0
+        self.peak_explored = 0
+        self.wall_time = 0.0
+        self.visualize_time = 0.0
+
+    @property
+    def search_time(self):
+        return self.wall_time - self.visualize_time
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild stats from ``to_dict`` output; derived and unknown keys are ignored."""
+        stats = cls()
+        for field in cls.FIELDS + ("error",):
+            if field in data and field != "search_time":
+                setattr(stats, field, data[field])
+        return stats
+
+    def summary(self):
+        """One-line summary for status bars and logs."""
+        return (
+            f"{self.expansions} expanded, {self.generated} generated, {self.pushes} pushed, "
+            f"{self.duplicates} duplicates | peak frontier {self.peak_frontier}, "
+            f"explored set {self.peak_explored} | search {self.search_time * 1000:.1f} ms, "
+            f"drawing {self.visualize_time * 1000:.1f} ms"
+        )
+
+
+def _instrumented(solve_method):
+    """
+    Run a solver with a fresh ``Maze.stats`` for it to fill in; the wall
+    time, outcome and explored-set size are recorded here.
+    """
+    @functools.wraps(solve_method)
+    def solver(self, *args, **kwargs):
+        stats = self.stats = SolveStats(_ALGORITHM_NAMES.get(solve_method.__name__, solve_method.__name__))
+        self.explored = None
+        started = time.perf_counter()
+        try:
+            path = solve_method(self, *args, **kwargs)
+        except Exception as e:
+            stats.error = str(e)
+            raise
+        finally:
+            stats.wall_time = time.perf_counter() - started
+            if not stats.peak_explored and self.explored is not None:
+                stats.peak_explored = self.explored.count(1)
+        stats.solved = True
+        stats.path_length = len(path)
+        return path
+
+    return solver
+
+
+# Open-direction bits stored per cell in Maze.open_dirs, in the order solvers expand them
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+
+# Reverse of each direction bit
+_REVERSE_BIT = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Reverse of each action, used when a path is recovered by walking back from the goal
+OPPOSITE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
+# Parent link of the search root (and of unreached cells) in the solvers' came_from arrays
+NO_PARENT = -1
+
+# Cells per band when building open_dirs; bounds the size of the temporary big integers
+NEIGHBOR_BAND_CELLS = 1 << 18
+
+# Smallest BFS level worth expanding with NumPy array operations instead of cell by cell
+WAVEFRONT_MIN_CELLS = 64
+
+# Byte translation from open_dirs to 1 for cells that are not plain corridor cells (degree other than 2)
+_JUNCTION_TABLE = bytes(1 if bin(i).count("1") in (1, 3, 4) else 0 for i in range(256))
+
+# Byte translation from wall flags to maze characters
+_TEXT_TABLE = b" #" + bytes(254)
+
+# Byte translation from wall flags to the ASCII digits of an open-cell bitboard
+_OPEN_DIGITS = b"10" + bytes(254)
+
+_ONE_BIT = re.compile("1")
+
+
+def _bit_indices(bits):
+    """Return the positions of the set bits of a non-negative integer, lowest first."""
+    low = (bits & -bits).bit_length() - 1
+    digits = bin(bits >> low)[:1:-1]
+    return [low + match.start() for match in _ONE_BIT.finditer(digits)]
+
+
+class Maze:
+    """
+    Maze stored as a compact flat grid.
+
+    Cells are addressed by flat indices (row * width + col). ``walls`` is a
+    bytearray with 1 for walls, and ``open_dirs`` holds one byte per cell with
+    the UP/DOWN/LEFT/RIGHT bits set for each direction that leads to an open
+    cell, so neighbour lookups never touch bounds checks or the wall grid.
+    """
+
+    def __init__(self, filename):
+        # Binary mazes are memory-mapped; text mazes are streamed line by line into the wall grid
+        if mazeFormat.is_binary(filename):
+            self._setup(*mazeFormat.read_binary(filename))
+        else:
+            self._setup(*mazeFormat.read_text(filename))
+
+    @classmethod
+    def from_text(cls, contents):
+        """Build a maze from its text form (``#`` walls, ``A`` start, ``B`` goal) without touching the disk."""
+        maze = cls.__new__(cls)
+        maze._setup(*mazeFormat.parse_text(contents.splitlines()))
+        return maze
+
+    def _setup(self, height, width, walls, start, goal):
+        self.height = height
+        self.width = width
+        self.walls = walls
+        self.start = start
+        self.goal = goal
+        self.build_neighbor_table()
+
+        self.solution = None
+        self.stats = SolveStats()
+
+    def build_neighbor_table(self):
+        """
+        Precompute ``open_dirs`` from ``walls``.
+
+        Each band of rows is treated as one big integer with a byte per cell,
+        so each direction is a single shift-and-mask instead of a Python loop
+        over cells. Bands (plus one halo row on each side) keep the temporary
+        integers small, so building the table of a huge maze costs little
+        more memory than the table itself.
+        """
+        width, height = self.width, self.height
+        self.open_dirs = bytearray(height * width)
+        band_rows = max(1, NEIGHBOR_BAND_CELLS // width)
+        for first in range(0, height, band_rows):
+            last = min(height, first + band_rows)
+            low, high = max(0, first - 1), min(height, last + 1)
+            size = (high - low) * width
+
+            full = (1 << (8 * size)) - 1
+            open_cells = int.from_bytes(self.walls[low * width:high * width].translate(bytes([1, 0]) + bytes(254)), "little")
+            not_first_col = int.from_bytes((b"\x00" + b"\x01" * (width - 1)) * (high - low), "little")
+            not_last_col = int.from_bytes((b"\x01" * (width - 1) + b"\x00") * (high - low), "little")
+
+            up = open_cells & (open_cells << (8 * width)) & full
+            down = open_cells & (open_cells >> (8 * width))
+            left = open_cells & (open_cells << 8) & not_first_col
+            right = open_cells & (open_cells >> 8) & not_last_col
+            table = (up * UP | down * DOWN | left * LEFT | right * RIGHT).to_bytes(size, "little")
+            offset = (first - low) * width
+            self.open_dirs[first * width:last * width] = table[offset:offset + (last - first) * width]
+
+        # (direction bit, action, index delta) in expansion order
+        self.moves = ((UP, "up", -width), (DOWN, "down", width), (LEFT, "left", -1), (RIGHT, "right", 1))
+        self.invalidate_caches()
+
+    def invalidate_caches(self):
+        """Drop everything derived from the walls, start or goal; called whenever one of them changes."""
+        self._heuristic_fields = {}
+        self._contracted_graph = None
+        self._goal_distances = None
+
+    @property
+    def start(self):
+        return self._start
+
+    @start.setter
+    def start(self, cell):
+        self._start = cell
+        self.invalidate_caches()
+
+    @property
+    def goal(self):
+        return self._goal
+
+    @goal.setter
+    def goal(self, cell):
+        self._goal = cell
+        self.invalidate_caches()
+
+    def heuristic_field(self, consistent=False, target=None):
+        """
+        Heuristic value of every cell for the current goal, as a flat array.
+
+        Built once per goal and cached until the walls or the goal change, so
+        informed solvers evaluate the heuristic with a single indexed load.
+        ``consistent=True`` gives the plain Manhattan distance; otherwise the
+        field matches ``heuristic``. ``target`` estimates distances to another
+        cell instead of the goal (used by the backward half of bidirectional A*).
+        """
+        key = (consistent, target or self.goal)
+        field = self._heuristic_fields.get(key)
+        if field is None:
+            field = self._build_heuristic_field(*key)
+            self._heuristic_fields[key] = field
+        return field
+
+    def _build_heuristic_field(self, consistent, target):
+        goal_row, goal_col = target
+        col_distance = [abs(col - goal_col) for col in range(self.width)]
+
+        # Open cells next to the goal, used by the goal-biased heuristic, by direction
+        open_sides = set()
+        if not consistent:
+            neighbours = (
+                (UP, goal_row - 1, goal_col), (DOWN, goal_row + 1, goal_col),
+                (LEFT, goal_row, goal_col - 1), (RIGHT, goal_row, goal_col + 1),
+            )
+            for bit, r, c in neighbours:
+                if 0 <= r < self.height and 0 <= c < self.width and not self.walls[r * self.width + c]:
+                    open_sides.add(bit)
+
+        field = array("i")
+        if not open_sides:
+            for row in range(self.height):
+                row_distance = abs(row - goal_row)
+                field.extend([row_distance + d for d in col_distance])
+            return field
+
+        # The biased value is the Manhattan distance D plus the distance to the
+        # nearest open cell next to the goal. That cell is D - 1 away from
+        # cells on its side of the goal and D + 1 from all others, so each
+        # row is twice its row distance plus a fixed per-column pattern.
+        closer = [2 * d - 1 for d in col_distance]
+        by_column = [
+            2 * d - 1 if (col < goal_col and LEFT in open_sides) or (col > goal_col and RIGHT in open_sides) else 2 * d + 1
+            for col, d in enumerate(col_distance)
+        ]
+        for row in range(self.height):
+            row_distance = 2 * abs(row - goal_row)
+            if (row < goal_row and UP in open_sides) or (row > goal_row and DOWN in open_sides):
+                field.extend([row_distance + d for d in closer])
+            else:
+                field.extend([row_distance + d for d in by_column])
+        return field
+
+    def content_hash(self):
+        """SHA-256 of the dimensions, start, goal and walls; identical mazes hash the same wherever they came from."""
+        digest = hashlib.sha256(f"{self.height}x{self.width}:{self.start}:{self.goal}:".encode())
+        digest.update(self.walls)
+        return digest.hexdigest()
+
+    def to_text(self):
+        """Text form of the maze, as read back by ``Maze(filename)`` and ``Maze.from_text``."""
+        chars = self.walls.translate(_TEXT_TABLE)
+        chars[self.index(self.start)] = ord("A")
+        chars[self.index(self.goal)] = ord("B")
+        return "".join(chars[i:i + self.width].decode("ascii") + "\n" for i in range(0, len(chars), self.width))
+
+    def index(self, cell):
+        """Flat index of a (row, col) cell."""
+        return cell[0] * self.width + cell[1]
+
+    def cell(self, index):
+        """(row, col) cell of a flat index."""
+        return divmod(index, self.width)
+
+    def is_wall(self, cell):
+        row, col = cell
+        return self.walls[row * self.width + col] == 1
+
+    @property
+    def num_explored(self):
+        """Expansions of the last solve; kept for callers that predate ``stats``."""
+        return self.stats.expansions
+
+    @num_explored.setter
+    def num_explored(self, value):
+        self.stats.expansions = value
+
+    def _start_recording(self, visualize=None):
+        """
+        Reset ``explored_order`` and return the callback a solver uses to
+        report each explored cell. Cells are only appended to the compact
+        buffer, so searches run at full speed; an optional ``visualize``
+        callback still receives (row, col) cells as they are explored, and
+        the time spent in it is added to ``stats.visualize_time``.
+        """
+        self.explored_order = array("i")
+        if visualize is None:
+            return self.explored_order.append
+
+        stats = self.stats
+
+        def record(state):
+            self.explored_order.append(state)
+            started = time.perf_counter()
+            visualize(self.cell(state))
+            stats.visualize_time += time.perf_counter() - started
+
+        return record
+
+    def neighbors(self, state):
+        """Return (action, index) pairs for the open neighbours of a flat cell index."""
+        dirs = self.open_dirs[state]
+        return [(action, state + delta) for bit, action, delta in self.moves if dirs & bit]
+
+    def search(
+        self, frontier, visualize=None, heuristic=None, cost_weight=1, close_on_pop=False, successors=None,
+        reconstruct=None,
+    ):
+        """
+        Search loop shared by every single-direction solver except the
+        local searches. Returns the path as backtrack_solution does, or None
+        if the goal cannot be reached.
+
+        ``frontier`` is a ``mazeFrontier`` policy and decides which cell is
+        expanded next. Prioritized frontiers get ``cost_weight * g +
+        heuristic[cell]`` for every cell: a weight of 0 gives greedy
+        best-first search, 1 gives A*.
+
+        By default a cell is marked visited when it is pushed, so it enters
+        the frontier at most once. With ``close_on_pop`` it is closed when it
+        is popped instead and pushed again whenever a shorter route to it
+        turns up before then. A closed cell is never reopened, so with A*
+        the path is only guaranteed shortest when the heuristic is
+        consistent.
+
+        ``successors(state, parent)`` replaces the open neighbours of a cell
+        with (index offset, step cost) pairs, such as jump points or corridor
+        ends, and ``reconstruct(came_from, goal)`` then turns the parent
+        links into the path instead of backtrack_solution.
+        Counters are kept in locals and added to ``stats`` at the end.
+        """
+        stats = self.stats
+        record = self._start_recording(visualize)
+        size = self.height * self.width
+        start = self.index(self.start)
+        goal = self.index(self.goal)
+        open_dirs = self.open_dirs
+        # (offset, step cost) of the open neighbours for every open_dirs value
+        unit_steps = [tuple((delta, 1) for bit, _, delta in self.moves if dirs & bit) for dirs in range(16)]
+        visited = self.explored = bytearray(size)
+        came_from = self.cell_array()
+        push, pop = frontier.push, frontier.pop
+        prioritized = frontier.prioritized
+        track_cost = close_on_pop or (prioritized and cost_weight != 0)
+        g = self.cell_array(size) if track_cost else None  # No path is longer than the number of cells
+
+        if track_cost:
+            g[start] = 0
+        if prioritized:
+            push(heuristic[start], start, 0)
+        else:
+            push(start)
+        if not close_on_pop:
+            visited[start] = 1
+
+        pending = 1
+        expansions = generated = pushes = duplicates = peak = 0
+        found = None
+        while pending:
+            if pending > peak:
+                peak = pending
+            state = pop()
+            pending -= 1
+            if close_on_pop:
+                if visited[state]:
+                    duplicates += 1  # Stale entry: the cell was already closed through a shorter route
+                    continue
+                visited[state] = 1
+
+            expansions += 1
+            record(state)  # Record explored state
+            if state == goal:
+                found = state
+                break
+
+            edges = unit_steps[open_dirs[state]] if successors is None else successors(state, came_from[state])
+            base = g[state] if track_cost else 0
+            for offset, step in edges:
+                child = state + offset
+                cost = base + step
+                generated += 1
+                if visited[child] or (close_on_pop and cost >= g[child]):
+                    duplicates += 1
+                    continue
+
+                came_from[child] = state
+                if track_cost:
+                    g[child] = cost
+                if not close_on_pop:
+                    visited[child] = 1
+                if prioritized:
+                    push(cost_weight * cost + heuristic[child], child, cost)
+                else:
+                    push(child)
+                pushes += 1
+                pending += 1
+
+        stats.expansions += expansions
+        stats.generated += generated
+        stats.pushes += pushes
+        stats.duplicates += duplicates
+        stats.peak_frontier = max(stats.peak_frontier, peak)
+        if found is None:
+            return None
+        return (reconstruct or self.backtrack_solution)(came_from, found)
+
+    @_instrumented
+    def bfs_solve(self, visualize=None):
+        path = self.search(mazeFrontier.FifoFrontier(), visualize)
+        if path is None:
+            raise Exception("no solution")
+        return path
+
+    @_instrumented
+    def bfs_wavefront_solve(self, visualize=None):
+        """
+        Wavefront BFS.
+
+        Instead of popping one node at a time, the whole frontier is expanded
+        per level: by _wavefront when NumPy is available, on big-int
+        bitboards otherwise. This fills ``distance_field`` with the BFS level
+        of every reached cell, and the path is recovered by walking the field
+        downhill from the goal.
+        """
+        stats = self.stats
+        start = self.index(self.start)
+        goal = self.index(self.goal)
+
+        record = self._start_recording(visualize)
+        record(start)
+
+        def on_level(cells):
+            stats.pushes += len(cells)
+            if len(cells) > stats.peak_frontier:
+                stats.peak_frontier = len(cells)
+            if visualize is None:
+                self.explored_order.extend(cells)
+            else:
+                for state in cells:
+                    record(state)
+
+        if np is not None:
+            self.distance_field, self.num_explored = self._wavefront(start, goal, on_level, stats)
+        else:
+            self.distance_field, self.num_explored = self._bitboard_wavefront(start, goal, on_level, stats)
+        stats.peak_explored = stats.pushes + 1  # Every reached cell, with the start
+
+        if self.distance_field[goal] < 0:
+            raise Exception("No solution found with Wavefront BFS.")
+        return self.descend_distance_field(self.distance_field, goal)
+
+    def _bitboard_wavefront(self, start, goal, on_level=None, stats=None):
+        """
+        Level-synchronous BFS on big-int row bitboards: bit c of a row's
+        integer is column c, so a whole row of the frontier moves left/right
+        with one shift and up/down by OR-ing into the adjacent rows, until
+        ``goal`` is reached.
+
+        Visited cells are masked out before successors are ever materialized,
+        so ``stats``, when given, only sees the new cells as generated.
+        """
+        width = self.width
+        unvisited = [
+            int(self.walls[offset:offset + width].translate(_OPEN_DIGITS)[::-1], 2)
+            for offset in range(0, self.height * width, width)
+        ]
+        distance = array("i", [-1]) * (self.height * width)
+        distance[start] = 0
+        start_row, start_col = divmod(start, width)
+        goal_row, goal_col = divmod(goal, width)
+        unvisited[start_row] &= ~(1 << start_col)
+        frontier = {start_row: 1 << start_col}
+        last_row = self.height - 1
+        expanded = 0
+        level_size = 1
+        level = 0
+
+        while frontier and unvisited[goal_row] >> goal_col & 1:
+            level += 1
+            expanded += level_size
+            next_frontier = {}
+            for row, bits in frontier.items():
+                moved = ((bits << 1) | (bits >> 1)) & unvisited[row]
+                if moved:
+                    next_frontier[row] = next_frontier.get(row, 0) | moved
+                if row > 0:
+                    moved = bits & unvisited[row - 1]
+                    if moved:
+                        next_frontier[row - 1] = next_frontier.get(row - 1, 0) | moved
+                if row < last_row:
+                    moved = bits & unvisited[row + 1]
+                    if moved:
+                        next_frontier[row + 1] = next_frontier.get(row + 1, 0) | moved
+
+            cells = []
+            for row, bits in next_frontier.items():
+                unvisited[row] ^= bits
+                offset = row * width
+                if bits & (bits - 1):
+                    cells.extend([offset + col for col in _bit_indices(bits)])
+                else:
+                    cells.append(offset + bits.bit_length() - 1)
+            for state in cells:
+                distance[state] = level
+            level_size = len(cells)
+            if stats is not None:
+                stats.generated += len(cells)
+            frontier = next_frontier
+            if on_level is not None:
+                on_level(cells)
+
+        return distance, expanded
+
+    def goal_distance_field(self):
+        """
+        Exact number of steps from every cell to the goal (-1 where the goal
+        is unreachable), from one reverse wavefront BFS out of the goal.
+        Cached until the walls or the goal change.
+        """
+        if self._goal_distances is None:
+            self._goal_distances, _ = self._wavefront(self.index(self.goal))
+        return self._goal_distances
+
+    def _wavefront(self, source, goal=None, on_level=None, stats=None):
+        """
+        Level-synchronous BFS from ``source``, until ``goal`` is reached or,
+        without a goal, over every reachable cell. Narrow levels, as in
+        corridor mazes, are expanded cell by cell; once a level holds
+        WAVEFRONT_MIN_CELLS cells and NumPy is available it is expanded with
+        array operations over the open_dirs table, which only pay off on wide
+        fronts such as open rooms.
+
+        Returns the steps from ``source`` to every cell (-1 where it was not
+        reached) and the number of cells in the levels that were expanded.
+        ``on_level`` gets the cells of each new level; successor counts go to
+        ``stats`` when given.
+        """
+        distance = array("i", [-1]) * (self.height * self.width)
+        distance[source] = 0
+        open_dirs = self.open_dirs
+        # Index offsets of the open neighbours for every open_dirs value
+        offsets = [tuple(delta for bit, _, delta in self.moves if dirs & bit) for dirs in range(16)]
+        if np is not None:
+            distance_view = np.frombuffer(distance, dtype=np.int32)
+            dirs_view = np.frombuffer(open_dirs, dtype=np.uint8)
+
+        cells = [source]
+        expanded = generated = duplicates = 0
+        level = 0
+        while len(cells) and (goal is None or distance[goal] < 0):
+            level += 1
+            expanded += len(cells)
+            if np is not None and len(cells) >= WAVEFRONT_MIN_CELLS:
+                frontier = np.asarray(cells, dtype=np.int64)
+                dirs = dirs_view[frontier]
+                candidates = np.concatenate([frontier[(dirs & bit) != 0] + delta for bit, _, delta in self.moves])
+                frontier = np.unique(candidates[distance_view[candidates] < 0])
+                distance_view[frontier] = level
+                generated += candidates.size
+                duplicates += candidates.size - frontier.size
+                cells = frontier if frontier.size >= WAVEFRONT_MIN_CELLS else frontier.tolist()
+                if on_level is not None:
+                    on_level(array("i", frontier.astype(np.int32).tobytes()))
+            else:
+                next_cells = []
+                for state in cells:
+                    for delta in offsets[open_dirs[state]]:
+                        child = state + delta
+                        generated += 1
+                        if distance[child] < 0:
+                            distance[child] = level
+                            next_cells.append(child)
+                        else:
+                            duplicates += 1
+                cells = next_cells
+                if on_level is not None:
+                    on_level(cells)
+
+        if stats is not None:
+            stats.generated += generated
+            stats.duplicates += duplicates
+        return distance, expanded
+
+    def distance_to_goal(self, cell):
+        """Steps from a (row, col) cell to the goal, or None if the goal cannot be reached."""
+        distance = self.goal_distance_field()[self.index(cell)]
+        return int(distance) if distance >= 0 else None
+
+    def path_from(self, cell):
+        """Shortest path from a (row, col) cell to the goal, excluding the cell itself, or None if there is none."""
+        distance = self.goal_distance_field()
+        state = self.index(cell)
+        if distance[state] < 0:
+            return None
+
+        cells = []
+        while distance[state] > 0:
+            dirs = self.open_dirs[state]
+            closer = distance[state] - 1
+            for bit, _, delta in self.moves:
+                if dirs & bit and distance[state + delta] == closer:
+                    state += delta
+                    cells.append(self.cell(state))
+                    break
+        return cells
+
+    def descend_distance_field(self, distance, goal):
+        """
+        Recover a path from a distance field by repeatedly stepping from the
+        goal to a neighbour one level closer to the source. Returns the same
+        cells and sets the same ``solution`` as backtrack_solution.
+        """
+        actions = []
+        cells = []
+        state = goal
+        while distance[state] > 0:
+            dirs = self.open_dirs[state]
+            closer = distance[state] - 1
+            for bit, action, delta in self.moves:
+                if dirs & bit and distance[state + delta] == closer:
+                    actions.append(OPPOSITE[action])
+                    cells.append(self.cell(state))
+                    state += delta
+                    break
+        actions.reverse()
+        cells.reverse()
+        self.solution = (actions, cells)
+        return cells
+
+    @_instrumented
+    def dfs_solve(self, visualize=None):
+        path = self.search(mazeFrontier.LifoFrontier(), visualize)
+        if path is None:
+            raise Exception("no solution")
+        return path
+
+    @_instrumented
+    def greedy_solve(self, visualize=None):
+        """Greedy Best-First Search."""
+        path = self.search(mazeFrontier.BucketFrontier(), visualize, heuristic=self.heuristic_field(), cost_weight=0)
+        if path is None:
+            raise Exception("No solution found with Greedy Best-First Search.")
+        return path
+
+    @_instrumented
+    def a_star_solve(self, visualize=None):
+        """A* Search."""
+        path = self.search(mazeFrontier.HeapFrontier(), visualize, heuristic=self.heuristic_field(), close_on_pop=True)
+        if path is None:
+            raise Exception("No solution found with A* Search.")
+        return path
+
+    @_instrumented
+    def a_star_optimal_solve(self, visualize=None):
+        """
+        A* Search that always returns a shortest path.
+
+        The Manhattan distance is consistent, so a closed cell never needs
+        reopening; a cell is pushed again only when a strictly shorter route
+        to it is found before it is closed. Ties on f are broken towards the
+        larger g, then by cell index, so runs are deterministic.
+        """
+        path = self.search(
+            mazeFrontier.DeepestFirstHeapFrontier(), visualize, heuristic=self.heuristic_field(consistent=True),
+            close_on_pop=True,
+        )
+        if path is None:
+            raise Exception("No solution found with A* Search.")
+        return path
+
+    @_instrumented
+    def a_star_exact_solve(self, visualize=None):
+        """
+        A* Search with the cached goal distance field as a perfect heuristic.
+
+        Every cell on a shortest path has the same f, and ties go to the
+        larger g, so only the cells of one shortest path are expanded. The
+        field costs one reverse BFS per goal; after that each solve is
+        linear in the path length.
+        """
+        heuristic = self.goal_distance_field()
+        if heuristic[self.index(self.start)] < 0:
+            # The field already shows the goal is out of reach; nothing is explored
+            self._start_recording(visualize)
+            self.explored = bytearray(self.height * self.width)
+            raise Exception("No solution found with Exact A* Search.")
+        path = self.search(mazeFrontier.DeepestFirstHeapFrontier(), visualize, heuristic=heuristic, close_on_pop=True)
+        if path is None:
+            raise Exception("No solution found with Exact A* Search.")
+        return path
+
+    @_instrumented
+    def bidirectional_bfs_solve(self, visualize=None):
+        """
+        Bidirectional BFS.
+
+        Runs BFS from the start and from the goal, always expanding a full
+        level of the smaller frontier, and stops after the first level in
+        which the two searches meet. The best meeting of that level is kept,
+        so the spliced path is a shortest path.
+        """
+        stats = self.stats
+        record = self._start_recording(visualize)
+        start = self.index(self.start)
+        goal = self.index(self.goal)
+        self.explored = bytearray(self.height * self.width)
+
+        # Per side: parent and distance (-1 until reached) of every cell, and the current level
+        forward, forward_g = self.cell_array(), self.cell_array()
+        backward, backward_g = self.cell_array(), self.cell_array()
+        forward_g[start] = 0
+        backward_g[goal] = 0
+        if start == goal:
+            # The sides only look for a meeting among new children, so an empty path never shows up as one
+            stats.expansions += 1
+            record(start)
+            return self.backtrack_solution(forward, start)
+        forward_level = [start]
+        backward_level = [goal]
+
+        while forward_level and backward_level:
+            if len(forward_level) + len(backward_level) > stats.peak_frontier:
+                stats.peak_frontier = len(forward_level) + len(backward_level)
+            if len(forward_level) <= len(backward_level):
+                side, side_g, other_g, level = forward, forward_g, backward_g, forward_level
+            else:
+                side, side_g, other_g, level = backward, backward_g, forward_g, backward_level
+
+            best = None
+            next_level = []
+            for state in level:
+                stats.expansions += 1
+                self.explored[state] = 1
+                record(state)  # Record explored state
+
+                cost = side_g[state] + 1
+                for _, child in self.neighbors(state):
+                    stats.generated += 1
+                    if side_g[child] >= 0:
+                        stats.duplicates += 1
+                        continue
+                    side[child] = state
+                    side_g[child] = cost
+                    next_level.append(child)
+                    stats.pushes += 1
+                    if other_g[child] >= 0 and (best is None or cost + other_g[child] < best[0]):
+                        best = (cost + other_g[child], child)
+
+            if best is not None:
+                return self.backtrack_solution(forward, best[1], backward)
+
+            if side is forward:
+                forward_level = next_level
+            else:
+                backward_level = next_level
+
+        raise Exception("No solution found with Bidirectional BFS.")
+
+    @_instrumented
+    def bidirectional_a_star_solve(self, visualize=None):
+        """
+        Bidirectional A* Search with balanced heuristics.
+
+        Runs A* from the start and from the goal, expanding the side with
+        the smaller open list. Each side is keyed on g plus half the
+        difference between the Manhattan distances to the two ends, so both
+        searches see the same non-negative reduced edge costs. Every time a
+        side reaches a cell the other side has already reached, the joined
+        route is a candidate, and the search stops as soon as the two
+        smallest keys add up to the best candidate, which proves it
+        shortest. Keys are doubled to stay integers.
+        """
+        stats = self.stats
+        record = self._start_recording(visualize)
+        start = self.index(self.start)
+        goal = self.index(self.goal)
+        self.explored = bytearray(self.height * self.width)
+
+        to_goal = self.heuristic_field(consistent=True)
+        to_start = self.heuristic_field(consistent=True, target=self.start)
+        # Per side: parent and best distance (-1 until reached) of every cell
+        forward, forward_g = self.cell_array(), self.cell_array()
+        backward, backward_g = self.cell_array(), self.cell_array()
+        forward_g[start] = 0
+        backward_g[goal] = 0
+        if start == goal:
+            # The sides only look for a meeting among new children, so an empty path never shows up as one
+            stats.expansions += 1
+            record(start)
+            return self.backtrack_solution(forward, start)
+        # Entries are (2 * g + sign * (to_goal - to_start), -g, cell); sign is 1 forward and -1 backward
+        forward_frontier = [(to_goal[start] - to_start[start], 0, start)]
+        backward_frontier = [(to_start[goal] - to_goal[goal], 0, goal)]
+
+        best_cost, best = None, None
+        while forward_frontier and backward_frontier:
+            if best_cost is not None and forward_frontier[0][0] + backward_frontier[0][0] >= 2 * best_cost:
+                break
+
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, side, side_g, other_g, sign = forward_frontier, forward, forward_g, backward_g, 1
+            else:
+                frontier, side, side_g, other_g, sign = backward_frontier, backward, backward_g, forward_g, -1
+
+            if len(forward_frontier) + len(backward_frontier) > stats.peak_frontier:
+                stats.peak_frontier = len(forward_frontier) + len(backward_frontier)
+            _, neg_g, state = heapq.heappop(frontier)
+            if -neg_g != side_g[state]:
+                stats.duplicates += 1
+                continue  # Stale entry: a shorter route to this cell was pushed later
+
+            stats.expansions += 1
+            self.explored[state] = 1
+            record(state)  # Record explored state
+
+            cost = side_g[state] + 1
+            for _, child in self.neighbors(state):
+                stats.generated += 1
+                if 0 <= side_g[child] <= cost:
+                    stats.duplicates += 1
+                    continue
+                side[child] = state
+                side_g[child] = cost
+                heapq.heappush(frontier, (2 * cost + sign * (to_goal[child] - to_start[child]), -cost, child))
+                stats.pushes += 1
+
+                if other_g[child] >= 0 and (best_cost is None or cost + other_g[child] < best_cost):
+                    best_cost = cost + other_g[child]
+                    best = child
+
+        if best is None:
+            raise Exception("No solution found with Bidirectional A* Search.")
+        return self.backtrack_solution(forward, best, backward)
+
+    @_instrumented
+    def jump_point_solve(self, visualize=None):
+        """
+        Jump Point Search, adapted to 4-connected movement.
+
+        Among equally short paths, only those that turn from a horizontal run
+        into a vertical one where they are forced to are considered. A forced
+        turn is one where the cell above or below becomes open after being
+        blocked for the previous cell. Vertical runs may turn anywhere, so a
+        vertical jump stops wherever a horizontal scan finds a jump point.
+        A* with the Manhattan heuristic then only expands the jump points,
+        which prunes most of the symmetric cells in open areas while keeping
+        paths optimal.
+        """
+        path = self.search(
+            mazeFrontier.DeepestFirstHeapFrontier(), visualize, heuristic=self.heuristic_field(consistent=True),
+            close_on_pop=True, successors=self._jump_successors, reconstruct=self._expand_jump_points,
+        )
+        if path is None:
+            raise Exception("No solution found with Jump Point Search.")
+        return path
+
+    def _jump_successors(self, state, parent):
+        """(offset, step cost) of every jump point reachable from ``state``, given the jump point it was reached from."""
+        goal = self.index(self.goal)
+        jump_points = []
+        for bit, _, delta in self._jump_directions(state, parent):
+            if bit & (UP | DOWN):
+                jump_point = self._jump_vertical(state, bit, delta, goal)
+            else:
+                jump_point = self._jump_horizontal(state, bit, delta, goal)
+            if jump_point is not None:
+                jump_points.append((jump_point - state, abs(jump_point - state) // abs(delta)))
+        return jump_points
+
+    def _jump_directions(self, state, parent):
+        """Moves worth trying from a jump point, given the jump point it was reached from."""
+        if parent == NO_PARENT:
+            return self.moves
+
+        arrived = self.step_between(parent, state)
+        if arrived[0] & (UP | DOWN):
+            # Vertical runs may continue or turn either way
+            return [move for move in self.moves if move[0] != _REVERSE_BIT[arrived[0]]]
+
+        # Horizontal runs continue, and turn only where the turn is forced
+        previous = state - arrived[2]
+        dirs = self.open_dirs[state]
+        return [
+            (bit, action, delta)
+            for bit, action, delta in self.moves
+            if bit == arrived[0] or (bit & (UP | DOWN) and dirs & bit and not self.open_dirs[previous] & bit)
+        ]
+
+    def _jump_horizontal(self, state, bit, delta, goal):
+        """Scan left or right until the goal or a forced vertical turn; None at a wall."""
+        open_dirs = self.open_dirs
+        while open_dirs[state] & bit:
+            previous = state
+            state += delta
+            if state == goal:
+                return state
+            dirs = open_dirs[state]
+            if (dirs & UP and not open_dirs[previous] & UP) or (dirs & DOWN and not open_dirs[previous] & DOWN):
+                return state
+        return None
+
+    def _jump_vertical(self, state, bit, delta, goal):
+        """Scan up or down until the goal or a cell from which a horizontal scan finds a jump point."""
+        open_dirs = self.open_dirs
+        while open_dirs[state] & bit:
+            state += delta
+            if state == goal:
+                return state
+            if (
+                self._jump_horizontal(state, LEFT, -1, goal) is not None
+                or self._jump_horizontal(state, RIGHT, 1, goal) is not None
+            ):
+                return state
+        return None
+
+    def _expand_jump_points(self, came_from, state):
+        """Turn the chain of jump points ending at ``state`` into the cell-by-cell path that backtrack_solution returns."""
+        jump_points = []
+        while came_from[state] != NO_PARENT:
+            jump_points.append(state)
+            state = came_from[state]
+        jump_points.reverse()
+
+        actions = []
+        cells = []
+        for jump_point in jump_points:
+            _, action, delta = self.step_between(state, jump_point)
+            while state != jump_point:
+                state += delta
+                actions.append(action)
+                cells.append(self.cell(state))
+        self.solution = (actions, cells)
+        return cells
+
+    def contracted_graph(self):
+        """
+        The maze contracted into a weighted graph.
+
+        Nodes are junctions, dead ends, the start and the goal; every other
+        open cell lies on a corridor with exactly two open neighbours. The
+        result maps each node to a list of (neighbour, corridor length, first
+        move) edges, where the first move is the (bit, action, delta) taken
+        out of the node. It is built once and cached until the walls, start
+        or goal change.
+        """
+        if self._contracted_graph is None:
+            self._contracted_graph = self._build_contracted_graph()
+        return self._contracted_graph
+
+    def _build_contracted_graph(self):
+        is_node = bytearray(self.open_dirs.translate(_JUNCTION_TABLE))
+        is_node[self.index(self.start)] = 1
+        is_node[self.index(self.goal)] = 1
+
+        graph = {match.start(): [] for match in re.finditer(b"\x01", is_node)}
+        move_of = {move[0]: move for move in self.moves}
+        walked = set()  # (node, first bit) pairs already covered from the other end
+
+        for node, edges in graph.items():
+            dirs = self.open_dirs[node]
+            for move in self.moves:
+                bit = move[0]
+                if not dirs & bit or (node, bit) in walked:
+                    continue
+
+                state, step, length = node, move, 0
+                while True:
+                    state += step[2]
+                    length += 1
+                    if is_node[state]:
+                        break
+                    step = move_of[self.open_dirs[state] & ~_REVERSE_BIT[step[0]]]
+
+                if state == node:
+                    continue  # A loop back to the same node never shortens a path
+                walked.add((state, _REVERSE_BIT[step[0]]))
+                edges.append((state, length, move))
+                graph[state].append((node, length, move_of[_REVERSE_BIT[step[0]]]))
+
+        return graph
+
+    @_instrumented
+    def contracted_solve(self, visualize=None):
+        """
+        A* Search on the contracted corridor graph.
+
+        Corridors are crossed in one step with their length as the edge cost
+        and the Manhattan distance as heuristic, so only junctions are
+        expanded. The resulting node chain is walked back out into cells.
+        """
+        graph = self.contracted_graph()
+
+        def successors(state, parent):
+            return [(node - state, length) for node, length, _ in graph[state]]
+
+        path = self.search(
+            mazeFrontier.DeepestFirstHeapFrontier(), visualize, heuristic=self.heuristic_field(consistent=True),
+            close_on_pop=True, successors=successors, reconstruct=self._expand_corridors,
+        )
+        if path is None:
+            raise Exception("No solution found with Contracted Graph Search.")
+        return path
+
+    def _expand_corridors(self, came_from, state):
+        """
+        Walk each corridor of a contracted-graph path to rebuild the cell path
+        backtrack_solution returns. Two nodes can share several corridors; a
+        shortest path always crosses the shortest of them.
+        """
+        graph = self.contracted_graph()
+        hops = []
+        while came_from[state] != NO_PARENT:
+            hops.append(state)
+            state = came_from[state]
+        hops.reverse()
+
+        move_of = {move[0]: move for move in self.moves}
+        actions = []
+        cells = []
+        for hop in hops:
+            _, step = min((length, move) for node, length, move in graph[state] if node == hop)
+            while True:
+                state += step[2]
+                actions.append(step[1])
+                cells.append(self.cell(state))
+                if state == hop:
+                    break
+                step = move_of[self.open_dirs[state] & ~_REVERSE_BIT[step[0]]]
+        self.solution = (actions, cells)
+        return cells
+
+    def cell_array(self, fill=NO_PARENT):
+        """A per-cell int array set to ``fill``, for parent links and path costs."""
+        return array("i", [fill]) * (self.height * self.width)
+
+    def step_between(self, parent, state):
+        """The (bit, action, delta) move heading from ``parent`` towards ``state`` in the same row or column."""
+        if parent // self.width == state // self.width:
+            bit = RIGHT if state > parent else LEFT
+        else:
+            bit = DOWN if state > parent else UP
+        return next(move for move in self.moves if move[0] == bit)
+
+    def backtrack_solution(self, came_from, state, backward=None):
+        """
+        Rebuild the path ending at ``state`` by following the ``came_from``
+        parent links back to the start. For bidirectional searches,
+        ``backward`` holds the goal side's parent links and the chain from
+        ``state`` to the goal is spliced on. Actions are recovered from the
+        index difference of each step.
+        """
+        states = []
+        current = state
+        while current != NO_PARENT:
+            states.append(current)
+            current = came_from[current]
+        states.reverse()
+        if backward is not None:
+            current = backward[state]
+            while current != NO_PARENT:
+                states.append(current)
+                current = backward[current]
+
+        actions = [self.step_between(parent, child)[1] for parent, child in zip(states, states[1:])]
+        cells = [self.cell(child) for child in states[1:]]
+        self.solution = (actions, cells)
+        return cells  # Return cells in the found path
+
+    def heuristic(self, state):
+        """A* heuristic that combines Manhattan distance with a bias toward open cells near the goal."""
+        return self.heuristic_field()[state]
+
+    @_instrumented
+    def hill_climb_solve(self, visualize=None):
+        """Hill Climbing Search."""
+        stats = self.stats
+        record = self._start_recording(visualize)
+        heuristic = self.heuristic_field()
+        state = self.index(self.start)
+        goal = self.index(self.goal)
+        self.explored = bytearray(self.height * self.width)
+        came_from = self.cell_array()
+
+        while True:
+            stats.expansions += 1
+            record(state)  # Record explored state
+
+            if state == goal:
+                return self.backtrack_solution(came_from, state)
+
+            self.explored[state] = 1
+
+            # Unexplored neighbors, of which the one with the best heuristic is taken
+            successors = self.neighbors(state)
+            neighbors = [child for _, child in successors if not self.explored[child]]
+            stats.generated += len(successors)
+            stats.duplicates += len(successors) - len(neighbors)
+
+            if not neighbors:
+                raise Exception("No solution found with Hill Climbing (stuck in local minima).")
+            if len(neighbors) > stats.peak_frontier:
+                stats.peak_frontier = len(neighbors)
+
+            # Choose the neighbor with the best heuristic (smallest value)
+            best_neighbor = min(neighbors, key=heuristic.__getitem__)
+
+            # If no improvement, stop (local minimum reached)
+            if heuristic[state] <= heuristic[best_neighbor]:
+                raise Exception("No solution found with Hill Climbing (local minima).")
+
+            came_from[best_neighbor] = state
+            state = best_neighbor
+            stats.pushes += 1
+
+    @_instrumented
+    def beam_search_solve(self, visualize=None, beam_width=2, widen=1, max_width=None):
+        """
+        Beam Search.
+
+        Each layer keeps only the ``beam_width`` children with the best
+        heuristic, picked with a bounded heap as they are generated, so a
+        layer never holds more than ``beam_width`` candidates however wide
+        the maze is. A cell reached twice within a layer is kept once, from
+        its first parent. Ties go to the earlier generated child.
+
+        With ``widen`` above 1, a beam that runs dry is restarted
+        ``widen`` times wider, up to ``max_width`` (default: every cell, at
+        which point nothing is pruned and the goal is found if reachable).
+        Fractional widths and factors are allowed; each width is rounded up
+        to a whole number of cells. The width that succeeded is left in
+        ``beam_width_used``.
+        """
+        record = self._start_recording(visualize)
+        max_width = math.floor(max_width) if max_width else self.height * self.width
+        width = max(1, math.ceil(beam_width))
+        while True:
+            self.beam_width_used = width
+            path = self._beam_search(record, width)
+            if path is not None:
+                return path
+            if widen <= 1 or width >= max_width:
+                raise Exception(f"No solution found with Beam Search (width {width}).")
+            width = min(max_width, math.ceil(width * widen))  # Whole widths, or the layer's heap is never formed
+
+    def _beam_search(self, record, width):
+        """One beam search of the given width; returns the path, or None when the beam runs dry."""
+        stats = self.stats
+        heuristic = self.heuristic_field()
+        size = self.height * self.width
+        start = self.index(self.start)
+        goal = self.index(self.goal)
+        open_dirs = self.open_dirs
+        moves = [(bit, delta) for bit, _, delta in self.moves]
+        explored = self.explored = bytearray(size)
+        came_from = self.cell_array()
+        seen = self.cell_array()  # Layer in which each cell was last generated
+
+        beam = [start]
+        depth = 0
+        expansions = generated = pushes = duplicates = peak = 0
+        found = None
+        while beam and found is None:
+            depth += 1
+            # Candidates as (-heuristic, -order, cell); once ``width`` are held they become a min-heap whose root is the worst one kept
+            best = []
+            full = False
+            order = 0
+            for state in beam:
+                expansions += 1
+                record(state)  # Record explored state
+                if state == goal:
+                    found = state
+                    break
+
+                explored[state] = 1
+                dirs = open_dirs[state]
+                for bit, delta in moves:
+                    if not dirs & bit:
+                        continue
+                    child = state + delta
+                    generated += 1
+                    if explored[child] or seen[child] == depth:
+                        duplicates += 1
+                        continue
+                    seen[child] = depth
+                    came_from[child] = state
+
+                    order += 1
+                    if not full:
+                        best.append((-heuristic[child], -order, child))
+                        pushes += 1
+                        if order == width:
+                            heapq.heapify(best)
+                            full = True
+                    elif -heuristic[child] > best[0][0]:  # Ties go to the earlier child, already kept
+                        heapq.heapreplace(best, (-heuristic[child], -order, child))
+                        pushes += 1
+
+            if len(best) > peak:
+                peak = len(best)
+            best.sort(reverse=True)
+            beam = [child for _, _, child in best]
+
+        stats.expansions += expansions
+        stats.generated += generated
+        stats.pushes += pushes
+        stats.duplicates += duplicates
+        stats.peak_frontier = max(stats.peak_frontier, peak)
+        stats.peak_explored = max(stats.peak_explored, explored.count(1))
+        return self.backtrack_solution(came_from, found) if found is not None else None
+
+
+def solve(maze, algorithm, beam_width=2, cache=None, beam_widen=1):
+    """
+    Solve a loaded maze headlessly and return a result dictionary: the
+    ``SolveStats`` fields plus ``explored``, the expansion count.
+    ``beam_width`` and ``beam_widen`` are passed to beam search as its width
+    and auto-widen factor.
+
+    With a ``solveCache.SolveCache``, a previously stored result for the same
+    maze, algorithm and parameters is returned instead (marked ``cached``)
+    and the maze's ``solution``, ``stats`` and ``explored_order`` are
+    restored from it. The solve is profiled when ``mazeProfiler`` is enabled.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{algorithm}', expected one of: {', '.join(ALGORITHMS)}")
+
+    solve_method = getattr(maze, ALGORITHMS[algorithm])
+    kwargs = {}
+    if algorithm == "beam":
+        kwargs["beam_width"] = beam_width
+        if beam_widen > 1:
+            # 2.0 from the command line must hit the same cache entry as the GUI's 2
+            kwargs["widen"] = int(beam_widen) if float(beam_widen).is_integer() else beam_widen
+
+    if cache is not None:
+        entry = cache.get(maze, algorithm, kwargs)
+        if entry is not None:
+            maze.solution = (entry["actions"], entry["path"]) if entry["path"] is not None else None
+            maze.stats = SolveStats.from_dict(entry["stats"])
+            maze.explored_order = entry["explored"]
+            return {"explored": maze.stats.expansions, **maze.stats.to_dict(), "cached": True}
+
+    maze.solution = None
+    with mazeProfiler.profiled(maze, algorithm, "solve"):
+        try:
+            solve_method(**kwargs)
+        except Exception:
+            pass  # Recorded in maze.stats.error
+    result = {"explored": maze.stats.expansions, **maze.stats.to_dict()}
+
+    if cache is not None:
+        cache.put(maze, algorithm, kwargs, result, maze.solution, maze.explored_order)
+    return result
+
+
+def solve_file(filename, algorithm, beam_width=2, cache_dir=None, beam_widen=1):
+    """
+    Load a maze file and solve it; errors are reported in the result instead
+    of raised. ``cache_dir`` enables the on-disk solve cache in that directory.
+    """
+    try:
+        maze = Maze(filename)
+    except Exception as e:
+        return {"file": filename, "algorithm": algorithm, "solved": False, "error": str(e)}
+
+    cache = solveCache.SolveCache(cache_dir) if cache_dir is not None else None
+    result = solve(maze, algorithm, beam_width=beam_width, cache=cache, beam_widen=beam_widen)
+    return {"file": filename, **result}
@@ -0,0 +1,189 @@
+"""
+Maze file formats.
+
+Text mazes use ``#`` for walls, spaces for open cells, ``A`` for the start
+and ``B`` for the goal; short lines are padded with open cells. They are
+read line by line straight into the wall grid.
+
+A binary ``.maze`` file is a 32-byte header followed by the wall plane: one
+bit per cell in row-major order, most significant bit first, 1 for walls,
+padded with zero bits to a whole byte. Loading maps the file and unpacks the
+plane with a couple of C-level conversions instead of parsing text.
+
+Convert the text maps in ``save/`` (or back) with:
+    python -m mazeFormat save/*.txt
+    python -m mazeFormat --to-text save/*.maze
+"""
+import argparse
+import glob
+import mmap
+import os
+import re
+import struct
+from array import array
+
+BINARY_EXTENSION = ".maze"
+MAGIC = b"MAZE"
+FORMAT_VERSION = 1
+
+# Magic, version, reserved, width, height, start row and column, goal row and column
+HEADER = struct.Struct("<4sHHIIIIII")
+
+# Byte translation used to turn a text row into wall flags: ' ', 'A' and 'B' are open, '#' is a wall
+_WALL_TABLE = bytes(0 if chr(i) in " AB" else 1 for i in range(256))
+_INVALID_CHAR = re.compile(rb"[^ #AB]")
+
+# Byte translations between wall flags and the ASCII digits of the packed plane
+_BIT_DIGITS = b"01" + bytes(254)
+_DIGIT_WALLS = bytes(1 if i == ord("1") else 0 for i in range(256))
+
+
+class MazeFormatError(ValueError):
+    """Malformed maze file; the message says where."""
+
+
+def read_text(filename):
+    """
+    Read a text maze line by line and return ``(height, width, walls, start,
+    goal)``, the same as ``read_binary``.
+    """
+    with open(filename) as f:
+        return parse_text(f, filename)
+
+
+def parse_text(lines, name="<text>"):
+    """
+    Build the wall grid from an iterable of text lines in a single pass,
+    validating characters and the start and goal as it goes.
+
+    Rows are appended unpadded to one bytearray as they arrive, with their
+    lengths kept on the side. When every line has the same length that
+    buffer already is the grid; otherwise the rows are laid out once at the
+    longest width after the last line, so peak memory stays within about
+    twice the size of the grid.
+    """
+    walls = bytearray()
+    lengths = array("I")
+    width = height = 0
+    markers = {b"A": None, b"B": None}
+    for height, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        data = line.encode("ascii", "replace")
+
+        bad = _INVALID_CHAR.search(data)
+        if bad:
+            raise MazeFormatError(f"{name}:{height}:{bad.start() + 1}: unexpected character {line[bad.start()]!r}")
+        for marker, found in markers.items():
+            col = data.find(marker)
+            while col >= 0:
+                if found is not None:
+                    raise MazeFormatError(
+                        f"{name}:{height}:{col + 1}: second {marker.decode()!r}, "
+                        f"the first is at {found[0] + 1}:{found[1] + 1}"
+                    )
+                found = markers[marker] = (height - 1, col)
+                col = data.find(marker, col + 1)
+
+        if len(data) > width:
+            width = len(data)
+        walls += data.translate(_WALL_TABLE)
+        lengths.append(len(data))
+
+    if not height:
+        raise MazeFormatError(f"{name}: empty maze")
+    for marker, found in markers.items():
+        if found is None:
+            raise MazeFormatError(f"{name}: no {'start' if marker == b'A' else 'goal'} point {marker.decode()!r}")
+    if len(walls) != height * width:
+        walls = _pad_rows(walls, lengths, width)
+    return height, width, walls, markers[b"A"], markers[b"B"]
+
+
+def _pad_rows(walls, lengths, width):
+    """Lay out rows stored back to back with the given ``lengths`` at ``width`` cells each, padding with open cells."""
+    padded = bytearray(len(lengths) * width)
+    offset = 0
+    for row, length in enumerate(lengths):
+        padded[row * width:row * width + length] = walls[offset:offset + length]
+        offset += length
+    return padded
+
+
+def is_binary(filename):
+    """True if ``filename`` starts with the binary maze magic."""
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def read_binary(filename):
+    """
+    Read a binary maze and return ``(height, width, walls, start, goal)``,
+    with ``walls`` as a bytearray holding 1 for walls.
+    """
+    with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if len(data) < HEADER.size:
+            raise MazeFormatError(f"{filename}: truncated maze header")
+        magic, version, _, width, height, start_row, start_col, goal_row, goal_col = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise MazeFormatError(f"{filename}: not a binary maze file")
+        if version != FORMAT_VERSION:
+            raise MazeFormatError(f"{filename}: unsupported maze format version {version}")
+
+        size = width * height
+        plane_size = (size + 7) // 8
+        if len(data) < HEADER.size + plane_size:
+            raise MazeFormatError(f"{filename}: truncated wall plane")
+        plane = data[HEADER.size:HEADER.size + plane_size]
+
+    # Unpack through a big integer: its binary digits are the wall bits, one ASCII byte each
+    digits = format(int.from_bytes(plane, "big"), f"0{8 * plane_size}b")
+    walls = bytearray(digits[:size].encode("ascii").translate(_DIGIT_WALLS))
+
+    start, goal = (start_row, start_col), (goal_row, goal_col)
+    for name, (row, col) in (("start", start), ("goal", goal)):
+        if not (row < height and col < width) or walls[row * width + col]:
+            raise MazeFormatError(f"{filename}: {name} is outside the maze or on a wall")
+    return height, width, walls, start, goal
+
+
+def write_binary(maze, filename):
+    """Write a maze in the binary format."""
+    size = maze.width * maze.height
+    plane_size = (size + 7) // 8
+    digits = maze.walls.translate(_BIT_DIGITS) + b"0" * (8 * plane_size - size)
+    plane = int(digits, 2).to_bytes(plane_size, "big") if size else b""
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, maze.width, maze.height, *maze.start, *maze.goal)
+    with open(filename, "wb") as f:
+        f.write(header)
+        f.write(plane)
+
+
+def convert(filename, to_text=False):
+    """Convert a maze file next to itself (``.txt`` to ``.maze``, or back) and return the new path."""
+    from mazeEngine import Maze
+
+    maze = Maze(filename)
+    root = os.path.splitext(filename)[0]
+    if to_text:
+        target = root + ".txt"
+        with open(target, "w") as f:
+            f.write(maze.to_text())
+    else:
+        target = root + BINARY_EXTENSION
+        write_binary(maze, target)
+    return target
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert text mazes to the binary format, or back.")
+    parser.add_argument("files", nargs="+", help="Maze files or glob patterns")
+    parser.add_argument("--to-text", action="store_true", help="Convert binary mazes back to text")
+    args = parser.parse_args(argv)
+
+    for pattern in args.files:
+        for filename in sorted(glob.glob(pattern)) or [pattern]:
+            print(f"{filename} -> {convert(filename, args.to_text)}")
+
+
+if __name__ == "__main__":
+    main()
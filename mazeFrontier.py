@@ -0,0 +1,120 @@
+"""
+Frontier policies for ``Maze.search``, the loop shared by the single-direction
+solvers. A policy only decides which pending cell is expanded next; the
+search loop does the rest.
+
+Every policy has ``push`` and ``pop`` methods. When ``prioritized`` is
+False, ``push`` takes just a cell and is the underlying container's own
+append method, so there is no Python-level call per cell. Otherwise
+``push`` takes ``(priority, cell, cost)``, where ``cost`` is the cell's g,
+and ``pop`` returns the cell with the lowest priority.
+"""
+import heapq
+from collections import deque
+
+
+class FifoFrontier:
+    """First in, first out: breadth-first order."""
+
+    prioritized = False
+
+    def __init__(self):
+        self.items = deque()
+        self.push = self.items.append
+        self.pop = self.items.popleft
+
+    def __len__(self):
+        return len(self.items)
+
+
+class LifoFrontier:
+    """Last in, first out: depth-first order."""
+
+    prioritized = False
+
+    def __init__(self):
+        self.items = []
+        self.push = self.items.append
+        self.pop = self.items.pop
+
+    def __len__(self):
+        return len(self.items)
+
+
+class HeapFrontier:
+    """Binary heap of (priority, cell); ties go to the lower cell index."""
+
+    prioritized = True
+
+    def __init__(self):
+        self.heap = []
+
+    def push(self, priority, state, cost=0):
+        heapq.heappush(self.heap, (priority, state))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[1]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class DeepestFirstHeapFrontier:
+    """
+    Binary heap of (priority, -cost, cell): ties go to the larger g, then to
+    the lower cell index. With an exact or near-exact heuristic this expands
+    along one shortest path instead of every cell on the f plateau.
+    """
+
+    prioritized = True
+
+    def __init__(self):
+        self.heap = []
+
+    def push(self, priority, state, cost=0):
+        heapq.heappush(self.heap, (priority, -cost, state))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class BucketFrontier:
+    """
+    Bucket queue for small non-negative integer priorities, such as the
+    Manhattan-based heuristic fields: one list per priority and a cursor at
+    the lowest one that may be non-empty, so pushes and pops cost O(1)
+    amortized instead of O(log n). Ties pop last in, first out, which favours
+    the most recently reached cells.
+    """
+
+    prioritized = True
+
+    def __init__(self):
+        self.buckets = []
+        self.lowest = 0
+        self.size = 0
+
+    def push(self, priority, state, cost=0):
+        buckets = self.buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(state)
+        if priority < self.lowest:
+            self.lowest = priority
+        self.size += 1
+
+    def pop(self):
+        buckets = self.buckets
+        lowest = self.lowest
+        while not buckets[lowest]:
+            lowest += 1
+        self.lowest = lowest
+        self.size -= 1
+        return buckets[lowest].pop()
+
+    def __len__(self):
+        return self.size
+
@@ -0,0 +1,139 @@
+"""
+Opt-in profiling of solves and redraws.
+
+Profiling is off unless the ``MAZE_PROFILE`` environment variable is set,
+either to an output directory or to ``1`` for the default one; the game's
+"Profile" toggle and ``mazeSolver solve --profile`` set it too, so worker
+processes inherit it. Every profiled run is written twice, named after the
+maze hash, the algorithm and what was profiled:
+
+    <hash>_<algorithm>_<label>_<time>_<pid>-<run>.pstats     for pstats / snakeviz
+    <hash>_<algorithm>_<label>_<time>_<pid>-<run>.collapsed  for flamegraph.pl / speedscope
+
+Compare hot paths between versions with, for example:
+    python -m pstats .cache/profiles/<file>.pstats
+"""
+import contextlib
+import cProfile
+import itertools
+import os
+import pstats
+import time
+
+PROFILE_ENV = "MAZE_PROFILE"
+DEFAULT_PROFILE_DIR = os.path.join(".cache", "profiles")
+
+# Call graph branches worth less than this many microseconds are left out of the collapsed stacks
+MIN_STACK_MICROSECONDS = 1
+
+_active = False  # cProfile cannot nest, so inner profiled() blocks run unprofiled
+_runs = itertools.count(1)  # Keeps runs of the same maze within one second apart
+
+
+def enabled():
+    return bool(os.environ.get(PROFILE_ENV))
+
+
+def profile_dir():
+    """Directory profiles are written to, from ``MAZE_PROFILE``."""
+    value = os.environ.get(PROFILE_ENV, "")
+    return DEFAULT_PROFILE_DIR if value in ("", "1") else value
+
+
+def enable(directory=None):
+    """Turn profiling on for this process and the processes it starts."""
+    os.environ[PROFILE_ENV] = directory or "1"
+
+
+def disable():
+    os.environ.pop(PROFILE_ENV, None)
+
+
+@contextlib.contextmanager
+def profiled(maze, algorithm, label):
+    """
+    Profile the block with cProfile when profiling is enabled, then dump it
+    for ``maze`` and ``algorithm``; otherwise run it as is.
+    """
+    global _active
+    if _active or not enabled():
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    _active = True
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _active = False
+        dump(profiler, maze, algorithm, label)
+
+
+def dump(profiler, maze, algorithm, label):
+    """Write the pstats and collapsed-stack files of a run and return the path they share, minus extension."""
+    directory = profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    name = f"{maze.content_hash()[:12]}_{algorithm}_{label}_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}-{next(_runs)}"
+    base = os.path.join(directory, name)
+
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(base + ".pstats")
+    with open(base + ".collapsed", "w") as f:
+        for stack, microseconds in collapsed_stacks(stats):
+            f.write(f"{stack} {microseconds}\n")
+    return base
+
+
+def collapsed_stacks(stats):
+    """
+    Yield (``"root;caller;callee"``, microseconds) pairs of self time.
+
+    cProfile only records caller/callee edges, not whole stacks, so the
+    stacks are rebuilt by walking the call graph down from its roots and
+    splitting each function's time among its callers in proportion to the
+    time each edge accounts for. Functions reached along a single path, like
+    the solver loops, come out exact; shared helpers are apportioned.
+    Frames of the profiling wrapper itself are left out: ``profiled`` is
+    resumed through the builtin ``next``, which the solvers call too, so it
+    would otherwise show up beneath solver frames.
+    """
+    callees = {}
+    roots = []
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if _is_wrapper(func):
+            continue
+        callers = {caller: edge for caller, edge in callers.items() if not _is_wrapper(caller)}
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    def walk(func, inclusive, path):
+        _, _, own, total, _ = stats.stats[func]
+        path = path + [_frame_name(func)]
+        if total > 0:
+            self_time = inclusive * own / total
+            if self_time * 1e6 >= MIN_STACK_MICROSECONDS:
+                yield ";".join(path), round(self_time * 1e6)
+        for callee, edge_total in callees.get(func, ()):
+            share = inclusive * edge_total / total if total > 0 else 0
+            if share * 1e6 >= MIN_STACK_MICROSECONDS and _frame_name(callee) not in path:
+                yield from walk(callee, share, path)
+
+    for root in roots:
+        yield from walk(root, stats.stats[root][3], [])
+
+
+def _is_wrapper(func):
+    """True for frames of ``profiled`` and the contextlib machinery around it."""
+    filename, _, name = func
+    return filename in (__file__, contextlib.__file__) or name == "<method 'disable' of '_lsprof.Profiler' objects>"
+
+
+def _frame_name(func):
+    filename, line, name = func
+    if filename == "~":  # Built-in
+        return name.replace(";", ",")
+    return f"{os.path.basename(filename)}:{line}({name})".replace(";", ",")
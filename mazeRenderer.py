@@ -0,0 +1,263 @@
+"""
+Canvas renderers used by MazeApp. Every cell has a colour kind (open, wall,
+start, goal, explored or path); the renderers only differ in how those colours
+reach the screen.
+"""
+import math
+import tkinter as tk
+
+# Colour kinds. The values double as the per-cell codes kept by ImageRenderer,
+# where OPEN and WALL line up with the 0/1 bytes of Maze.walls.
+OPEN, WALL, START, GOAL, EXPLORED, PATH = range(6)
+
+# (fill, outline) of the cell rectangles
+CELL_COLOURS = {
+    OPEN: ("white", "white"),
+    WALL: ("black", "white"),
+    START: ("red", "white"),
+    GOAL: ("green", "white"),
+    EXPLORED: ("yellow", "yellow"),
+    PATH: ("blue", "blue"),
+}
+
+# Pixel colours of the maze image
+IMAGE_COLOURS = {
+    OPEN: (255, 255, 255),
+    WALL: (0, 0, 0),
+    START: (255, 0, 0),
+    GOAL: (0, 128, 0),
+    EXPLORED: (255, 255, 0),
+    PATH: (0, 0, 255),
+}
+_HEX_COLOURS = {kind: "#%02x%02x%02x" % rgb for kind, rgb in IMAGE_COLOURS.items()}
+# Per-channel byte translations from cell codes to pixel values
+_CHANNELS = [
+    bytes(IMAGE_COLOURS.get(code, (0, 0, 0))[channel] for code in range(256))
+    for channel in range(3)
+]
+# Turns explored and path cells back into open cells
+_CLEAR_TABLE = bytes(OPEN if code in (EXPLORED, PATH) else code for code in range(256))
+
+# Pixels per cell the image renderer can zoom between
+ZOOM_LEVELS = (1 / 16, 1 / 8, 1 / 4, 1 / 2, 1, 2, 4, 8, 16, 32)
+
+# One put call per cell costs roughly as much as re-encoding this many cells
+# of a row band, which decides how a batch of painted cells is uploaded
+PIXEL_PUT_COST = 500
+
+# Smallest size, in pixels, of the player and hint markers when zoomed out
+MIN_MARKER_SIZE = 6
+
+
+class CellRenderer:
+    """
+    One canvas rectangle per cell, created once by ``draw`` and recoloured
+    in place. Used when the whole maze fits on the canvas at ``cell_size``.
+    """
+
+    def __init__(self, canvas, maze, cell_size=20):
+        self.canvas = canvas
+        self.maze = maze
+        self.cell_size = cell_size
+        self.cell_items = []
+        self.on_view_change = None  # The view never moves, so this is never called
+
+    def draw(self):
+        """Create the cell rectangles; walls are tagged "wall", every other cell "open"."""
+        self.canvas.delete("cell")
+        self.cell_items = []
+        for row in range(self.maze.height):
+            for col in range(self.maze.width):
+                x1 = col * self.cell_size
+                y1 = row * self.cell_size
+                x2 = x1 + self.cell_size
+                y2 = y1 + self.cell_size
+
+                if self.maze.is_wall((row, col)):  # Wall
+                    item = self.canvas.create_rectangle(x1, y1, x2, y2, fill="black", outline="white", tags=("cell", "wall"))
+                else:  # Empty space
+                    item = self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="white", tags=("cell", "open"))
+                self.cell_items.append(item)
+
+        self.draw_special_cells()
+
+    def paint(self, states, kind):
+        """Recolour the cells at the given flat indices."""
+        fill, outline = CELL_COLOURS[kind]
+        for state in states:
+            self.canvas.itemconfig(self.cell_items[state], fill=fill, outline=outline)
+
+    def clear(self):
+        """Turn every non-wall cell back to open, then redraw the start and goal."""
+        self.canvas.itemconfig("open", fill="white", outline="white")
+        self.draw_special_cells()
+
+    def draw_special_cells(self):
+        self.paint([self.maze.index(self.maze.start)], START)
+        self.paint([self.maze.index(self.maze.goal)], GOAL)
+
+    def cell_bbox(self, cell):
+        """Canvas rectangle covered by a (row, col) cell."""
+        row, col = cell
+        x1, y1 = col * self.cell_size, row * self.cell_size
+        return x1, y1, x1 + self.cell_size, y1 + self.cell_size
+
+    def zoom(self, steps, x=None, y=None):
+        pass  # The whole maze is always shown at ``cell_size``
+
+    def start_pan(self, x, y):
+        pass
+
+    def pan(self, x, y):
+        pass
+
+
+class ImageRenderer:
+    """
+    Paints the maze into a PhotoImage with one pixel per cell and shows the
+    visible part of it, scaled to the current zoom level, on the canvas.
+
+    Painting only uploads what changed: a few cells are put one pixel at a
+    time, larger batches re-encode the band of rows they touch as a binary
+    PPM. Either way only the viewport is copied back to the screen, so mazes
+    with millions of cells stay interactive.
+    """
+
+    def __init__(self, canvas, maze):
+        self.canvas = canvas
+        self.maze = maze
+        self.width = int(canvas["width"])
+        self.height = int(canvas["height"])
+        self.codes = bytearray()
+        self.image = tk.PhotoImage(master=canvas, width=maze.width, height=maze.height)
+        self.view = tk.PhotoImage(master=canvas, width=self.width, height=self.height)
+        self.on_view_change = None  # Called after every zoom or scroll
+        self.xscroll = None  # Scrollbar set() callbacks
+        self.yscroll = None
+        self.x0 = self.y0 = 0  # Top-left visible cell
+        self.pan_anchor = None
+
+        # Start at the largest zoom level that shows the whole maze
+        self.scale = ZOOM_LEVELS[0]
+        for scale in ZOOM_LEVELS:
+            if maze.width * scale <= self.width and maze.height * scale <= self.height:
+                self.scale = scale
+
+    def draw(self):
+        self.codes = bytearray(self.maze.walls)
+        self.codes[self.maze.index(self.maze.start)] = START
+        self.codes[self.maze.index(self.maze.goal)] = GOAL
+        self.upload_rows(0, self.maze.height - 1)
+        self.canvas.delete("cell")
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.view, tags=("cell",))
+        self.refresh()
+
+    def paint(self, states, kind):
+        """Recolour the cells at the given flat indices."""
+        if not states:
+            return
+        codes = self.codes
+        for state in states:
+            codes[state] = kind
+
+        width = self.maze.width
+        first_row, last_row = min(states) // width, max(states) // width
+        if len(states) * PIXEL_PUT_COST < (last_row - first_row + 1) * width:
+            colour = _HEX_COLOURS[kind]
+            for state in states:
+                row, col = divmod(state, width)
+                self.image.put(colour, to=(col, row))
+        else:
+            self.upload_rows(first_row, last_row)
+        self.refresh()
+
+    def clear(self):
+        """Turn every explored and path cell back to open, then redraw the start and goal."""
+        self.codes = self.codes.translate(_CLEAR_TABLE)
+        self.codes[self.maze.index(self.maze.start)] = START
+        self.codes[self.maze.index(self.maze.goal)] = GOAL
+        self.upload_rows(0, self.maze.height - 1)
+        self.refresh()
+
+    def upload_rows(self, first_row, last_row):
+        """Re-encode rows ``first_row``..``last_row`` of the cell codes into the maze image."""
+        width = self.maze.width
+        codes = self.codes[first_row * width:(last_row + 1) * width]
+        pixels = bytearray(3 * len(codes))
+        for channel, table in enumerate(_CHANNELS):
+            pixels[channel::3] = codes.translate(table)
+        header = f"P6\n{width} {last_row - first_row + 1}\n255\n".encode("ascii")
+        self.image.tk.call(self.image, "put", header + pixels, "-format", "ppm", "-to", 0, first_row)
+
+    def refresh(self):
+        """Copy the visible part of the maze image onto the canvas and update the scrollbars."""
+        visible_cols, visible_rows = self.visible_cells()
+        x2 = min(self.maze.width, self.x0 + math.ceil(visible_cols))
+        y2 = min(self.maze.height, self.y0 + math.ceil(visible_rows))
+        if self.scale >= 1:
+            resize = ("-zoom", int(self.scale), int(self.scale))
+        else:
+            resize = ("-subsample", round(1 / self.scale), round(1 / self.scale))
+
+        self.view.blank()
+        self.view.tk.call(self.view, "copy", self.image, "-from", self.x0, self.y0, x2, y2, "-to", 0, 0, *resize)
+
+        if self.xscroll is not None:
+            self.xscroll(self.x0 / self.maze.width, min(1.0, (self.x0 + visible_cols) / self.maze.width))
+        if self.yscroll is not None:
+            self.yscroll(self.y0 / self.maze.height, min(1.0, (self.y0 + visible_rows) / self.maze.height))
+
+    def visible_cells(self):
+        """Number of columns and rows that fit on the canvas at the current zoom level."""
+        return self.width / self.scale, self.height / self.scale
+
+    def scroll_to(self, x0, y0):
+        """Move the top-left corner of the view to cell column ``x0``, row ``y0``, clamped to the maze."""
+        visible_cols, visible_rows = self.visible_cells()
+        self.x0 = max(0, min(int(x0), math.ceil(self.maze.width - visible_cols)))
+        self.y0 = max(0, min(int(y0), math.ceil(self.maze.height - visible_rows)))
+        self.refresh()
+        if self.on_view_change is not None:
+            self.on_view_change()
+
+    def xview(self, *args):
+        """Scrollbar command for horizontal scrolling."""
+        self.scroll_to(self._scroll_target(self.x0, self.maze.width, self.visible_cells()[0], args), self.y0)
+
+    def yview(self, *args):
+        """Scrollbar command for vertical scrolling."""
+        self.scroll_to(self.x0, self._scroll_target(self.y0, self.maze.height, self.visible_cells()[1], args))
+
+    @staticmethod
+    def _scroll_target(position, total, visible, args):
+        if args[0] == "moveto":
+            return float(args[1]) * total
+        step = visible * 0.9 if args[2] == "pages" else max(1, visible / 20)
+        return position + int(args[1]) * step
+
+    def zoom(self, steps, x=None, y=None):
+        """Zoom in (positive ``steps``) or out, keeping the cell under canvas point (x, y) in place."""
+        level = max(0, min(ZOOM_LEVELS.index(self.scale) + steps, len(ZOOM_LEVELS) - 1))
+        if x is None:
+            x, y = self.width / 2, self.height / 2
+        col, row = self.x0 + x / self.scale, self.y0 + y / self.scale
+        self.scale = ZOOM_LEVELS[level]
+        self.scroll_to(col - x / self.scale, row - y / self.scale)
+
+    def start_pan(self, x, y):
+        self.pan_anchor = (x, y, self.x0, self.y0)
+
+    def pan(self, x, y):
+        """Drag the view so the cell grabbed in ``start_pan`` follows the pointer."""
+        if self.pan_anchor is None:
+            return
+        anchor_x, anchor_y, x0, y0 = self.pan_anchor
+        self.scroll_to(x0 - (x - anchor_x) / self.scale, y0 - (y - anchor_y) / self.scale)
+
+    def cell_bbox(self, cell):
+        """Canvas rectangle of a (row, col) cell, grown to ``MIN_MARKER_SIZE`` when zoomed far out."""
+        row, col = cell
+        size = max(self.scale, MIN_MARKER_SIZE)
+        x = (col - self.x0 + 0.5) * self.scale
+        y = (row - self.y0 + 0.5) * self.scale
+        return x - size / 2, y - size / 2, x + size / 2, y + size / 2
@@ -0,0 +1,162 @@
+"""
+Command line interface for batch solving maze files and generating maze
+corpora without a display.
+
+Examples:
+    python -m mazeSolver solve save/*.txt --algo astar --jobs 8 --output results.jsonl
+    python -m mazeSolver solve save/*.txt --algo jps --jobs 1 --profile
+    python -m mazeSolver generate corpus --count 100 --size 50x30 --size 200x200 --seed 42 --jobs 8
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import mazeEngine
+import mazeProfiler
+import randomMaze
+import solveCache
+
+# Manifest written next to a generated corpus, one JSON record per maze
+MANIFEST_NAME = "manifest.jsonl"
+
+
+def expand_paths(patterns):
+    """Expand glob patterns ourselves so quoted patterns also work on Windows shells."""
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        files.extend(matches if matches else [pattern])
+    return files
+
+
+def solve_corpus(files, algorithm, jobs=1, beam_width=2, cache_dir=None, beam_widen=1):
+    """Yield one result per maze file, in input order, using a process pool when jobs > 1."""
+    worker = partial(mazeEngine.solve_file, algorithm=algorithm, beam_width=beam_width, cache_dir=cache_dir, beam_widen=beam_widen)
+    if jobs <= 1:
+        yield from map(worker, files)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, len(files) // (jobs * 4))
+        yield from pool.map(worker, files, chunksize=chunksize)
+
+
+def generate_corpus(directory, count, sizes, master_seed=0, algorithm="braided", jobs=1):
+    """
+    Generate ``count`` mazes into ``directory`` and yield their manifest
+    records in index order. Maze ``i`` has size ``sizes[i % len(sizes)]`` and
+    a seed derived from ``master_seed`` and ``i``, so the corpus is the same
+    for any number of jobs.
+    """
+    os.makedirs(directory, exist_ok=True)
+    indices = range(count)
+    widths = [sizes[i % len(sizes)][0] for i in indices]
+    heights = [sizes[i % len(sizes)][1] for i in indices]
+    seeds = [randomMaze.derive_seed(master_seed, i) for i in indices]
+    columns = (indices, widths, heights, seeds, [algorithm] * count, [directory] * count)
+    if jobs <= 1:
+        yield from map(randomMaze.generate_file, *columns)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, count // (jobs * 4))
+        yield from pool.map(randomMaze.generate_file, *columns, chunksize=chunksize)
+
+
+def parse_size(text):
+    """Parse a WIDTHxHEIGHT size in cells."""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size {text!r}; expected WIDTHxHEIGHT, e.g. 50x30")
+    if width < 2 or height < 2:
+        raise argparse.ArgumentTypeError(f"invalid size {text!r}; mazes must be at least 2x2 cells")
+    return width, height
+
+
+def _non_negative_int(text):
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {value}")
+    return value
+
+
+def _widen_factor(text):
+    value = float(text)
+    if not value >= 1:  # Also rejects nan
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {text}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="mazeSolver", description="Headless maze solver and corpus generator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = subparsers.add_parser("solve", help="Solve maze files and write JSONL results")
+    solve_parser.add_argument("files", nargs="+", help="Maze files or glob patterns")
+    solve_parser.add_argument("--algo", default="bfs", choices=sorted(mazeEngine.ALGORITHMS), help="Search algorithm")
+    solve_parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    solve_parser.add_argument("--beam-width", type=int, default=2, help="Beam width for beam search")
+    solve_parser.add_argument(
+        "--beam-widen", type=_widen_factor, default=1, metavar="FACTOR",
+        help="Restart a failed beam search this many times wider until it succeeds (default: 1, no restarts)",
+    )
+    solve_parser.add_argument("--output", help="JSONL output file (default: stdout)")
+    solve_parser.add_argument("--cache", action="store_true", help="Reuse and store results in the on-disk solve cache")
+    solve_parser.add_argument("--cache-dir", default=solveCache.DEFAULT_CACHE_DIR, help="Solve cache directory")
+    solve_parser.add_argument(
+        "--profile", nargs="?", const=mazeProfiler.DEFAULT_PROFILE_DIR, metavar="DIR",
+        help=f"Write a cProfile dump of every solve to DIR (default: {mazeProfiler.DEFAULT_PROFILE_DIR})",
+    )
+
+    generate_parser = subparsers.add_parser("generate", help="Generate a reproducible corpus of random mazes")
+    generate_parser.add_argument("directory", help="Output directory for the mazes and manifest.jsonl")
+    generate_parser.add_argument("--count", type=_non_negative_int, default=10, help="Number of mazes")
+    generate_parser.add_argument("--size", type=parse_size, action="append", help="WIDTHxHEIGHT in cells; repeat to cycle through sizes")
+    generate_parser.add_argument("--seed", type=int, default=0, help="Master seed the per-maze seeds are derived from")
+    generate_parser.add_argument("--algorithm", default="braided", choices=sorted(randomMaze.GENERATORS), help="Maze generator")
+    generate_parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "generate":
+        return generate_main(args)
+    files = expand_paths(args.files)
+    if args.profile:
+        mazeProfiler.enable(args.profile)  # Through the environment, so pool workers profile too
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+    try:
+        cache_dir = args.cache_dir if args.cache else None
+        results = solve_corpus(files, args.algo, jobs=args.jobs, beam_width=args.beam_width, cache_dir=cache_dir, beam_widen=args.beam_widen)
+        for result in results:
+            if not result["solved"]:
+                failures += 1
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return 1 if failures else 0
+
+
+def generate_main(args):
+    sizes = args.size or [(randomMaze.DEFAULT_WIDTH, randomMaze.DEFAULT_HEIGHT)]
+    records = generate_corpus(args.directory, args.count, sizes, args.seed, args.algorithm, jobs=args.jobs)
+    os.makedirs(args.directory, exist_ok=True)
+    with open(os.path.join(args.directory, MANIFEST_NAME), "w") as manifest:
+        for record in records:
+            manifest.write(json.dumps(record) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,104 +1,315 @@
+import argparse
+import hashlib
 import os
 import random
+import sys
 
-def generate_complex_maze(width, height, start, goal):
-    # Initialize maze with walls
+from mazeEngine import Maze
+
+# Default maze size, in cells (the text grid is 2 * size + 1 characters each way)
+DEFAULT_WIDTH, DEFAULT_HEIGHT = 27, 14
+
+
+def carve_passages(maze, width, height, start, rng):
+    """Carve a perfect maze into the character grid with an iterative recursive backtracker."""
+    x, y = start
+    stack = [(x, y)]
+    maze[2 * y + 1][2 * x + 1] = ' '
+
+    while stack:
+        x, y = stack[-1]
+
+        # Find unvisited neighbors
+        neighbours = []
+        for nx, ny in [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]:
+            if 0 <= nx < width and 0 <= ny < height:
+                if maze[2 * ny + 1][2 * nx + 1] == '#':
+                    neighbours.append((nx, ny))
+
+        if neighbours:
+            # Choose a random unvisited neighbour and add it to the stack
+            nx, ny = rng.choice(neighbours)
+            stack.append((nx, ny))
+
+            # Remove wall between cells
+            maze[y + ny + 1][x + nx + 1] = ' '
+            maze[2 * ny + 1][2 * nx + 1] = ' '
+        else:
+            stack.pop()
+
+
+def generate_perfect_maze(width, height, start, goal, rng=random):
+    """Maze with exactly one path between any two cells."""
     maze = [['#' for _ in range(2 * width + 1)] for _ in range(2 * height + 1)]
-    
-    # Function to add passages with more connections near the start
-    def add_passages(x, y):
-        stack = [(x, y)]
-        visited = set()
-        
-        while stack:
-            x, y = stack[-1]
-            visited.add((x, y))
-            maze[2 * y + 1][2 * x + 1] = ' '
+    carve_passages(maze, width, height, start, rng)
+    return maze
 
-            # Find unvisited neighbors
-            neighbours = []
-            for nx, ny in [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]:
-                if 0 <= nx < width and 0 <= ny < height:
-                    if maze[2 * ny + 1][2 * nx + 1] == '#':
-                        neighbours.append((nx, ny))
-            
-            if neighbours:
-                # Choose a random unvisited neighbour and add it to the stack
-                nx, ny = random.choice(neighbours)
-                stack.append((nx, ny))
-                
-                # Remove wall between cells
-                maze[y + ny + 1][x + nx + 1] = ' '
-            else:
-                stack.pop()
-
-    # Start adding passages from the start position
-    start_x, start_y = start
-    add_passages(start_x, start_y)
 
-    # Add extra paths for connectivity near the start area
-    for _ in range(int(width * height * 0.8)):  # Increase density near the start
-        rand_x, rand_y = random.randint(0, width // 3), random.randint(0, height // 3)
-        maze[2 * rand_y + 1][2 * rand_x + 1] = ' '
+class DisjointSet:
+    """Union-find over the integers 0..size-1, with path halving and union by size."""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
 
-    # Add random passages throughout for better interconnectivity
-    for _ in range(int(width * height * 1.5)):
-        rand_x, rand_y = random.randint(1, width - 1), random.randint(1, height - 1)
-        maze[2 * rand_y + 1][2 * rand_x + 1] = ' '
+    def union(self, a, b):
+        """Merge the sets holding ``a`` and ``b``; returns False if they were already one set."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+
+# Chance of knocking out a wall that would create a loop, near the start and elsewhere
+NEAR_START_BRAID_CHANCE = 0.3
+BRAID_CHANCE = 0.1
+
+
+def generate_complex_maze(width, height, start, goal, rng=random):
+    """
+    Braided maze: a randomized Kruskal spanning tree with some extra openings
+    for loops, denser around the start.
+
+    Cells are joined in a union-find set as walls are knocked out, and every
+    wall is considered once, so the maze comes out connected by construction:
+    generation is a single pass linear in the maze area, with no solvability
+    search and no retries.
+    """
+    # Initialize maze with walls, then open every cell
+    maze = [['#' for _ in range(2 * width + 1)] for _ in range(2 * height + 1)]
+    for y in range(height):
+        for x in range(width):
+            maze[2 * y + 1][2 * x + 1] = ' '
+
+    # Walls between neighbouring cells in random order: 2 * cell is the wall to its right, 2 * cell + 1 the one below
+    cells = width * height
+    walls = [2 * cell for cell in range(cells) if cell % width != width - 1]
+    walls += [2 * cell + 1 for cell in range(cells - width)]
+    rng.shuffle(walls)
+
+    start_x, start_y = start
+    near_x, near_y = max(1, width // 6), max(1, height // 6)
+    sets = DisjointSet(cells)
+    for wall in walls:
+        cell, below = divmod(wall, 2)
+        y, x = divmod(cell, width)
+        neighbour = cell + width if below else cell + 1
+        if sets.union(cell, neighbour):
+            pass  # Joins two separate regions: part of the spanning tree
+        elif abs(x - start_x) <= near_x and abs(y - start_y) <= near_y:
+            if rng.random() >= NEAR_START_BRAID_CHANCE:
+                continue
+        elif rng.random() >= BRAID_CHANCE:
+            continue
+        maze[2 * y + 1 + below][2 * x + 2 - below] = ' '
 
     # Mark the start and goal positions
     maze[2 * start_y + 1][2 * start_x + 1] = 'A'  # Start point 'A'
     goal_x, goal_y = goal
     maze[2 * goal_y + 1][2 * goal_x + 1] = 'B'  # Goal point 'B'
-    
-    # Ensure there is a valid solution path from start to goal using BFS
-    def is_valid_move(x, y):
-        return 0 <= x < width and 0 <= y < height and maze[2 * y + 1][2 * x + 1] != '#'
-
-    def bfs(start, goal):
-        """Perform a BFS to check if there's a path between start and goal."""
-        queue = [start]
-        visited = set()
-        visited.add(start)
-        
-        while queue:
-            x, y = queue.pop(0)
-            if (x, y) == goal:
-                return True  # Path found
-            
-            # Explore neighbors
-            for nx, ny in [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]:
-                if is_valid_move(nx, ny) and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append((nx, ny))
-        
-        return False  # No path found
-
-    # Ensure at least one valid path from start to goal
-    if not bfs(start, goal):
-        print("No solution found between start and goal, regenerating maze...")
-        return generate_complex_maze(width, height, start, goal)
+
+    # The spanning tree reaches every cell, so this is a formality costing two finds
+    if not sets.connected(start_y * width + start_x, goal_y * width + goal_x):
+        raise RuntimeError("Generated maze does not connect start and goal")
 
     return maze
 
+
+def eller_rows(width, height, start, goal, rng=random):
+    """
+    Yield the text rows of a perfect maze built with Eller's algorithm, top
+    to bottom, in the same ``#``/space/``A``/``B`` format as the other
+    generators.
+
+    Only the set labels of the current row are kept, so memory is bounded by
+    the width no matter how many rows are produced.
+    """
+    border = "#" * (2 * width + 1)
+    yield border
+
+    # Set label of each cell in the current row, and the columns in each set
+    row_sets = list(range(width))
+    members = {label: [x] for x, label in enumerate(row_sets)}
+    next_label = width
+
+    for y in range(height):
+        last = y == height - 1
+        line = ["#"] * (2 * width + 1)
+        line[1::2] = " " * width
+
+        # Join neighbours from different sets at random; the last row joins all of them
+        for x in range(width - 1):
+            a, b = row_sets[x], row_sets[x + 1]
+            if a != b and (last or rng.random() < 0.5):
+                line[2 * x + 2] = " "
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for col in members[b]:
+                    row_sets[col] = a
+                members[a] += members.pop(b)
+
+        if y == start[1]:
+            line[2 * start[0] + 1] = "A"
+        if y == goal[1]:
+            line[2 * goal[0] + 1] = "B"
+        yield "".join(line)
+        if last:
+            break
+
+        # Every set continues down through at least one cell, so no region is cut off
+        down = [False] * width
+        for cols in members.values():
+            down[rng.choice(cols)] = True
+            for col in cols:
+                if rng.random() < 0.5:
+                    down[col] = True
+        yield "#" + "".join(" #" if passage else "##" for passage in down)
+
+        # Cells below a passage keep their set; the rest start new ones
+        members = {}
+        for x in range(width):
+            if not down[x]:
+                row_sets[x] = next_label
+                next_label += 1
+            members.setdefault(row_sets[x], []).append(x)
+
+    yield border
+
+
+def generate_eller_maze(width, height, start, goal, rng=random):
+    """Perfect maze from Eller's algorithm, collected into a character grid."""
+    return [list(row) for row in eller_rows(width, height, start, goal, rng)]
+
+
+# Generator algorithms by name; each takes (width, height, start, goal, rng) and returns a character grid
+GENERATORS = {
+    "braided": generate_complex_maze,
+    "perfect": generate_perfect_maze,
+    "eller": generate_eller_maze,
+}
+
+
+def pick_endpoints(width, height, rng):
+    """Random start and goal cells, never the same one."""
+    start = (rng.randrange(width), rng.randrange(height))
+    goal = start
+    while goal == start:
+        goal = (rng.randrange(width), rng.randrange(height))
+    return start, goal
+
+
+def generate(width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, seed=None, algorithm="braided"):
+    """
+    Generate a random maze of ``width`` x ``height`` cells in memory and
+    return it as a ``Maze``. The same seed and parameters always give the
+    same maze; ``seed=None`` picks a fresh one.
+    """
+    if algorithm not in GENERATORS:
+        raise ValueError(f"Unknown maze algorithm {algorithm!r}; choose from {', '.join(GENERATORS)}")
+    if width < 2 or height < 2:
+        raise ValueError("Maze must be at least 2x2 cells")
+
+    rng = random.Random(seed)
+    start, goal = pick_endpoints(width, height, rng)
+    grid = GENERATORS[algorithm](width, height, start, goal, rng)
+    # The perfect generator leaves the markers to us; re-marking is harmless for the others
+    grid[2 * start[1] + 1][2 * start[0] + 1] = 'A'
+    grid[2 * goal[1] + 1][2 * goal[0] + 1] = 'B'
+    return Maze.from_text("\n".join("".join(row) for row in grid))
+
+
 def save_maze_to_file(maze, file_path):
     # Ensure the directory exists
     directory = os.path.dirname(file_path)
     if not os.path.exists(directory) and directory != '':
         os.makedirs(directory)
-    
+
     with open(file_path, "w") as file:
-        for row in maze:
-            file.write(''.join(row) + '\n')
+        file.write(maze.to_text())
+
+
+def derive_seed(master_seed, index):
+    """Seed of maze ``index`` in a batch; depends only on the master seed and index, never on scheduling."""
+    digest = hashlib.sha256(f"{master_seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def generate_file(index, width, height, seed, algorithm, directory):
+    """
+    Generate one maze of a batch into ``directory`` and return its manifest
+    record. Module level so process pools can pickle it.
+    """
+    maze = generate(width, height, seed, algorithm)
+    filename = f"maze_{index:05d}.txt"
+    save_maze_to_file(maze, os.path.join(directory, filename))
+    return {
+        "index": index,
+        "file": filename,
+        "seed": seed,
+        "algorithm": algorithm,
+        "width": width,
+        "height": height,
+        "start": list(maze.start),
+        "goal": list(maze.goal),
+        "hash": maze.content_hash(),
+    }
+
+
+def stream_maze(file, width, height, seed=None):
+    """
+    Write an Eller's algorithm maze to an open text file one row at a time,
+    holding only a single row in memory. Returns the (x, y) start and goal.
+    """
+    if width < 2 or height < 2:
+        raise ValueError("Maze must be at least 2x2 cells")
+    rng = random.Random(seed)
+    start, goal = pick_endpoints(width, height, rng)
+    for row in eller_rows(width, height, start, goal, rng):
+        file.write(row + "\n")
+    return start, goal
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a random maze and save it as text.")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH, help="width in cells")
+    parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT, help="height in cells")
+    parser.add_argument("--seed", type=int, default=None, help="random seed, for reproducible mazes")
+    parser.add_argument("--algorithm", choices=sorted(GENERATORS), default="braided")
+    parser.add_argument("--output", default="maze.txt", help="file to write, or - for stdout (default: maze.txt)")
+    args = parser.parse_args(argv)
+
+    # Eller's algorithm streams rows straight to the output, so its mazes never have to fit in memory
+    if args.algorithm == "eller":
+        if args.output == "-":
+            stream_maze(sys.stdout, args.width, args.height, args.seed)
+        else:
+            directory = os.path.dirname(args.output)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(args.output, "w") as file:
+                stream_maze(file, args.width, args.height, args.seed)
+        return
 
-# Maze dimensions
-maze_width, maze_height = 27, 14
+    maze = generate(args.width, args.height, args.seed, args.algorithm)
+    if args.output == "-":
+        sys.stdout.write(maze.to_text())
+    else:
+        save_maze_to_file(maze, args.output)
 
-# Random start and goal positions
-start = (random.randint(0, maze_width - 1), random.randint(0, maze_height - 1))  # 1 start
-goal = (random.randint(0, maze_width - 1), random.randint(0, maze_height - 1))  # 1 goal
 
-# Generate and save the maze
-maze = generate_complex_maze(maze_width, maze_height, start, goal)
-maze_path = "maze.txt"
-save_maze_to_file(maze, maze_path)
+if __name__ == "__main__":
+    main()
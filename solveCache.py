@@ -0,0 +1,133 @@
+"""
+On-disk cache of solve results, keyed by the maze content plus the algorithm
+and its parameters, so re-solving a map that was already solved is instant.
+"""
+import base64
+import binascii
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from array import array
+
+# Bump when solver behaviour changes so stale results are never replayed
+CACHE_VERSION = 7
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "solves")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class SolveCache:
+    """
+    Directory of JSON entries, one per (maze, algorithm, parameters) key.
+
+    Each entry holds the path, the explored order and the result stats.
+    Recency is tracked through file modification times: hits touch their
+    entry, and once the directory grows past ``max_bytes`` the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, maze, algorithm, params=None):
+        """Cache key for solving ``maze`` with ``algorithm`` and its parameters."""
+        params = json.dumps(params or {}, sort_keys=True)
+        text = f"{CACHE_VERSION}:{maze.content_hash()}:{algorithm}:{params}"
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get(self, maze, algorithm, params=None):
+        """
+        Return the cached entry as a dict with ``path`` and ``actions`` (None
+        if the solve failed), ``explored`` (flat cell indices in exploration
+        order, as an ``array('i')``) and ``stats``; or None on a miss.
+        """
+        entry_path = self._entry_path(self.key(maze, algorithm, params))
+        try:
+            with open(entry_path) as f:
+                entry = json.load(f)
+            os.utime(entry_path)  # Mark as recently used
+        except (OSError, ValueError):
+            return None
+
+        try:
+            explored = array("i")
+            explored.frombytes(zlib.decompress(base64.b64decode(entry["explored"])))
+            path_cells = entry["path"]
+            entry = {
+                "stats": dict(entry["stats"]),
+                "actions": entry["actions"],
+                "path": [tuple(cell) for cell in path_cells] if path_cells is not None else None,
+                "explored": explored,
+            }
+        except (zlib.error, binascii.Error, KeyError, TypeError, ValueError):
+            # Corrupt or truncated entry: treat it as a miss and drop it
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def put(self, maze, algorithm, params, stats, solution, explored):
+        """
+        Store a result. ``solution`` is the maze's (actions, cells) pair or
+        None for a failed solve, and ``explored`` is the maze's
+        ``explored_order`` buffer of flat cell indices.
+        """
+        explored = array("i", explored)
+        entry = {
+            "stats": stats,
+            "actions": solution[0] if solution else None,
+            "path": solution[1] if solution else None,
+            "explored": base64.b64encode(zlib.compress(explored.tobytes())).decode("ascii"),
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, self._entry_path(self.key(maze, algorithm, params)))
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                info = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue  # Removed by another process
+            entries.append((info.st_mtime, info.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Remove every cached entry."""
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + ".json")
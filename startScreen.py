@@ -1,7 +1,7 @@
 import tkinter as tk
-from tkinter import messagebox
 import os
-import subprocess
+import mazeFormat
+import randomMaze
 import visualizeState  # Assuming this handles the maze visualization
 from drawCustomMap import DrawCustomMap
 
@@ -103,17 +103,10 @@ class StartScreen(tk.Tk):
     def play_with_random_map(self):
         self.destroy()
 
-        # Running randomMaze.py to generate a random maze
-        subprocess.run(["python", "randomMaze.py"])
-        maze_file = "maze.txt"
-
-        if os.path.exists(maze_file):
-            # Visualize the generated maze
-            maze = visualizeState.Maze(maze_file)
-            app = visualizeState.MazeApp(maze)
-            app.mainloop()
-        else:
-            messagebox.showerror("Error", "Failed to generate random maze!")
+        # Generate a random maze in memory and visualize it
+        maze = randomMaze.generate()
+        app = visualizeState.MazeApp(maze)
+        app.mainloop()
 
     def open_map_selector(self):
         map_selector = tk.Toplevel(self)
@@ -140,20 +133,22 @@ class StartScreen(tk.Tk):
         if not os.path.exists(save_dir):
             os.makedirs(save_dir)
 
-        for file in os.listdir(save_dir):
-            if file.endswith(".txt"):
-                map_name = file.replace(".txt", "")
-                button = tk.Button(
-                    map_selector,
-                    text=map_name,
-                    font=("Helvetica", 14),
-                    fg="#2c3e50",
-                    bg="#ecf0f1",
-                    command=lambda f=file: self.load_selected_map(
-                        os.path.join(save_dir, f), map_selector, self
-                    ),
-                )
-                button.pack(pady=5)
+        # Text and binary maps are both listed; the format is shown when a map exists in both
+        map_files = sorted(file for file in os.listdir(save_dir) if file.endswith((".txt", mazeFormat.BINARY_EXTENSION)))
+        names = [os.path.splitext(file)[0] for file in map_files]
+        for file, name in zip(map_files, names):
+            map_name = name if names.count(name) == 1 else file
+            button = tk.Button(
+                map_selector,
+                text=map_name,
+                font=("Helvetica", 14),
+                fg="#2c3e50",
+                bg="#ecf0f1",
+                command=lambda f=file: self.load_selected_map(
+                    os.path.join(save_dir, f), map_selector, self
+                ),
+            )
+            button.pack(pady=5)
 
     def load_selected_map(self, filename, map_selector_window, startScreen):
         # Close the map selector window
@@ -1,303 +1,55 @@
 import sys
 import re
 import tkinter as tk
-from tkinter import simpledialog
-from queue import Queue
-import heapq
-import subprocess
+from tkinter import filedialog, simpledialog
+import random
 import os
+import time
 import startScreen
+import solveCache
+import mazeProfiler
+import mazeRenderer
+import randomMaze
+from mazeEngine import Maze, SolveStats
 
-class Node:
-    def __init__(self, state, parent=None, action=None, cost=0, priority=0):
-        self.state = state
-        self.parent = parent
-        self.action = action
-        self.cost = cost
-        self.priority = priority
-
-    def __lt__(self, other):
-        return self.priority < other.priority
-
-class Maze:
-    def __init__(self, filename):
-        with open(filename) as f:
-            contents = f.read()
-
-        if contents.count("A") != 1 or contents.count("B") != 1:
-            raise Exception("Maze must have exactly one start point and one goal")
-
-        contents = contents.splitlines()
-        self.height = len(contents)
-        self.width = max(len(line) for line in contents)
-
-        self.walls = []
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                try:
-                    if contents[i][j] == "A":
-                        self.start = (i, j)
-                        row.append(False)
-                    elif contents[i][j] == "B":
-                        self.goal = (i, j)
-                        row.append(False)
-                    elif contents[i][j] == " ":
-                        row.append(False)
-                    else:
-                        row.append(True)
-                except IndexError:
-                    row.append(False)
-            self.walls.append(row)
-
-        self.solution = None
-        self.num_explored = 0
-
-    def neighbors(self, state):
-        row, col = state
-        candidates = [
-            ("up", (row - 1, col)),
-            ("down", (row + 1, col)),
-            ("left", (row, col - 1)),
-            ("right", (row, col + 1))
-        ]
-        result = []
-        for action, (r, c) in candidates:
-            if 0 <= r < self.height and 0 <= c < self.width and not self.walls[r][c]:
-                result.append((action, (r, c)))
-        return result
-
-    def bfs_solve(self, visualize):
-        self.num_explored = 0
-        start = Node(state=self.start, parent=None, action=None)
-        self.explored = set()
-
-        frontier = Queue()
-        frontier.put(start)
-
-        while not frontier.empty():
-            node = frontier.get()
-            self.num_explored += 1
-            visualize(node.state)  # Visualize explored state
-
-            if node.state == self.goal:
-                return self.backtrack_solution(node)
-
-            self.explored.add(node.state)
-            for action, state in self.neighbors(node.state):
-                if state not in self.explored:
-                    child = Node(state=state, parent=node, action=action)
-                    frontier.put(child)
-
-        raise Exception("no solution")
-
-    def dfs_solve(self, visualize):
-        self.num_explored = 0
-        start = Node(state=self.start, parent=None, action=None)
-        self.explored = set()
-
-        frontier = []  # Using a list as a stack
-        frontier.append(start)
-
-        while frontier:
-            node = frontier.pop()
-            self.num_explored += 1
-            visualize(node.state)  # Visualize explored state
-
-            if node.state == self.goal:
-                return self.backtrack_solution(node)
-
-            self.explored.add(node.state)
-            for action, state in self.neighbors(node.state):
-                if state not in self.explored:
-                    child = Node(state=state, parent=node, action=action)
-                    frontier.append(child)
-
-        raise Exception("no solution")
-
-    def greedy_solve(self, visualize):
-        """Greedy Best-First Search."""
-        self.num_explored = 0
-        start = Node(state=self.start, parent=None, action=None)
-        start.priority = self.heuristic(start.state)
-        self.explored = set()
-
-        frontier = []
-        heapq.heappush(frontier, (start.priority, start))
-
-        while frontier:
-            _, node = heapq.heappop(frontier)
-            self.num_explored += 1
-            visualize(node.state)  # Visualize explored state
-
-            if node.state == self.goal:
-                return self.backtrack_solution(node)
-
-            self.explored.add(node.state)
-            for action, state in self.neighbors(node.state):
-                if state not in self.explored:
-                    child = Node(state=state, parent=node, action=action)
-                    child.priority = self.heuristic(state)
-                    heapq.heappush(frontier, (child.priority, child))
-
-        raise Exception("No solution found with Greedy Best-First Search.")
-
-    def a_star_solve(self, visualize):
-        """A* Search."""
-        self.num_explored = 0
-        start = Node(state=self.start, parent=None, action=None, cost=0)
-        start.priority = self.heuristic(start.state)
-        self.explored = set()
-
-        frontier = []
-        heapq.heappush(frontier, (start.priority, start))
-
-        while frontier:
-            _, node = heapq.heappop(frontier)
-            self.num_explored += 1
-            visualize(node.state)  # Visualize explored state
-
-            if node.state == self.goal:
-                return self.backtrack_solution(node)
-
-            self.explored.add(node.state)
-            for action, state in self.neighbors(node.state):
-                if state not in self.explored:
-                    child = Node(state=state, parent=node, action=action, cost=node.cost + 1)
-                    child.priority = child.cost + self.heuristic(state)
-                    heapq.heappush(frontier, (child.priority, child))
-
-        raise Exception("No solution found with A* Search.")
-
-    def backtrack_solution(self, node):
-        actions = []
-        cells = []
-        while node.parent is not None:
-            actions.append(node.action)
-            cells.append(node.state)
-            node = node.parent
-        actions.reverse()
-        cells.reverse()
-        self.solution = (actions, cells)
-        return cells  # Return cells in the found path
-
-    def heuristic(self, state):
-        """A* heuristic that combines Manhattan distance with a bias toward open cells near the goal."""
-        row, col = state
-        goal_row, goal_col = self.goal
-
-        # Calculate the basic Manhattan distance to the goal (B)
-        base_distance = abs(row - goal_row) + abs(col - goal_col)
-
-        # Initialize the minimum distance to an adjacent empty cell near the goal (B)
-        min_distance_to_empty = float('inf')
-
-        # Check the neighboring cells of the goal (B)
-        for r_offset, c_offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            neighbor_row = goal_row + r_offset
-            neighbor_col = goal_col + c_offset
-
-            # Ensure the neighbor is within bounds
-            if 0 <= neighbor_row < self.height and 0 <= neighbor_col < self.width:
-                # Check if the neighbor is an empty cell
-                if not self.walls[neighbor_row][neighbor_col]:
-                    # Calculate the distance from the current state to this empty cell
-                    distance_to_empty = abs(row - neighbor_row) + abs(col - neighbor_col)
-                    min_distance_to_empty = min(min_distance_to_empty, distance_to_empty)
-
-        # If we found an empty neighboring cell, prioritize paths leading to it
-        if min_distance_to_empty < float('inf'):
-            return base_distance + min_distance_to_empty  # Encourage moving towards nearby empty cells
-
-        return base_distance  # Fallback to the base Manhattan distance
-    def hill_climb_solve(self, visualize):
-        """Hill Climbing Search."""
-        self.num_explored = 0
-        start = Node(state=self.start, parent=None, action=None)
-        self.explored = set()
-
-        current_node = start
-        while True:
-            self.num_explored += 1
-            visualize(current_node.state)
-
-            if current_node.state == self.goal:
-                return self.backtrack_solution(current_node)
-
-            self.explored.add(current_node.state)
-
-            # Get all neighbors and sort by heuristic value (ascending)
-            neighbors = [
-                Node(state=state, parent=current_node, action=action)
-                for action, state in self.neighbors(current_node.state)
-                if state not in self.explored
-            ]
-            for neighbor in neighbors:
-                neighbor.priority = self.heuristic(neighbor.state)
-
-            if not neighbors:
-                raise Exception("No solution found with Hill Climbing (stuck in local minima).")
-
-            # Choose the neighbor with the best heuristic (smallest value)
-            best_neighbor = min(neighbors, key=lambda x: x.priority)
-
-            # If no improvement, stop (local minimum reached)
-            if self.heuristic(current_node.state) <= best_neighbor.priority:
-                raise Exception("No solution found with Hill Climbing (local minima).")
-
-            current_node = best_neighbor
-    def beam_search_solve(self, visualize, beam_width=2):
-        """Beam Search."""
-        self.num_explored = 0
-        start = Node(state=self.start, parent=None, action=None)
-        self.explored = set()
-
-        frontier = [(self.heuristic(start.state), start)]  # Priority queue of (heuristic, node)
-
-        while frontier:
-            self.num_explored += len(frontier)
-
-            # Sort frontier by heuristic and keep only the best `beam_width` nodes
-            frontier.sort(key=lambda x: x[0])
-            frontier = frontier[:beam_width]
-
-            next_frontier = []
-            for _, node in frontier:
-                visualize(node.state)
-
-                if node.state == self.goal:
-                    return self.backtrack_solution(node)
-
-                self.explored.add(node.state)
-                for action, state in self.neighbors(node.state):
-                    if state not in self.explored:
-                        child = Node(state=state, parent=node, action=action)
-                        child.priority = self.heuristic(state)
-                        next_frontier.append((child.priority, child))
-
-            frontier = next_frontier
-
-        raise Exception("No solution found with Beam Search.")
+# Delay between replay frames (about 60 frames per second)
+FRAME_INTERVAL_MS = 16
 
+# Largest canvas; mazes that do not fit at cell_size are drawn by the zoomable image renderer
+MAX_CANVAS_WIDTH = 1400
+MAX_CANVAS_HEIGHT = 700
 
 class MazeApp(tk.Tk):
     def __init__(self, maze):
         super().__init__()
         self.maze = maze
+        self.solve_cache = solveCache.SolveCache()
+        self.replay = None  # Exploration currently being replayed on the canvas
+        self.replay_job = None
+        self.renderer = None
+        self.hint_path = None
         self.cell_size = 20  # Can be adjusted if needed
         self.title("Maze Solver")
         
-        # Calculate window dimensions for a 15-inch screen (approx 1440px width)
-        window_width = min(self.maze.width * self.cell_size + 40, 1440)
-        window_height = self.maze.height * self.cell_size + 200
         self.configure(bg="#2c3e50")  # Set background color to match StartScreen
 
-        # Center the window on the screen with calculated dimensions
-        self.center_window(window_width, window_height)
+        # Center the window on the screen with dimensions fitted to the maze
+        self.fit_window()
+
+        # Canvas and UI setup; the scrollbars are only shown for mazes too large for the canvas
+        canvas_frame = tk.Frame(self, bg="#2c3e50")
+        canvas_frame.grid(row=0, column=0, columnspan=6, pady=(20, 10), padx=10)
+        self.canvas = tk.Canvas(canvas_frame, bg="#2c3e50", highlightthickness=0)
+        self.canvas.grid(row=0, column=0)
+        self.x_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL)
+        self.y_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
 
-        # Canvas and UI setup
-        self.canvas = tk.Canvas(self, width=self.maze.width * self.cell_size, height=self.maze.height * self.cell_size, bg="#2c3e50", highlightthickness=0)
-        self.canvas.grid(row=0, column=0, columnspan=6, pady=(20, 10), padx=10)
+        # Mouse wheel zooms and dragging pans the image renderer
+        self.canvas.bind("<MouseWheel>", lambda event: self.renderer.zoom(1 if event.delta > 0 else -1, event.x, event.y))
+        self.canvas.bind("<Button-4>", lambda event: self.renderer.zoom(1, event.x, event.y))
+        self.canvas.bind("<Button-5>", lambda event: self.renderer.zoom(-1, event.x, event.y))
+        self.canvas.bind("<ButtonPress-1>", lambda event: self.renderer.start_pan(event.x, event.y))
+        self.canvas.bind("<B1-Motion>", lambda event: self.renderer.pan(event.x, event.y))
 
         self.status_label = tk.Label(self, text="Welcome to Maze Solver", font=("Helvetica", 14, "bold"), fg="#ecf0f1", bg="#2c3e50")
         self.status_label.grid(row=1, column=0, columnspan=6, pady=(5, 10))
@@ -321,8 +73,15 @@ class MazeApp(tk.Tk):
         self.selected_algorithm = tk.StringVar(value="Select Algorithm")
         algorithms = [
             "Solve BFS",
+            "Solve BFS (Wavefront)",
+            "Solve Bidirectional BFS",
             "Solve DFS",
             "Solve A*",
+            "Solve A* (Optimal)",
+            "Solve A* (Exact)",
+            "Solve Bidirectional A*",
+            "Solve Jump Point Search",
+            "Solve Contracted Graph",
             "Solve Greedy",
             "Solve Hill Climbing",
             "Solve Beam Search",
@@ -360,7 +119,79 @@ class MazeApp(tk.Tk):
         self.apply_button.grid(row=2, column=1, padx=(5, 10), pady=10)
 
         tk.Button(self, text="Generate Maze", command=self.generate_maze, **button_style).grid(row=2, column=3, padx=5, pady=5)
+        # Size, seed and algorithm of generated mazes; a blank seed picks a random one
+        generator_frame = tk.Frame(self, bg="#2c3e50")
+        generator_frame.grid(row=3, column=3, columnspan=2, padx=5, pady=5)
+        label_style = {"font": ("Arial", 10), "fg": "#ecf0f1", "bg": "#2c3e50"}
+        self.generate_width = tk.IntVar(value=randomMaze.DEFAULT_WIDTH)
+        self.generate_height = tk.IntVar(value=randomMaze.DEFAULT_HEIGHT)
+        self.generate_seed = tk.StringVar()
+        self.generate_algorithm = tk.StringVar(value="braided")
+        tk.Label(generator_frame, text="Width", **label_style).grid(row=0, column=0)
+        tk.Spinbox(generator_frame, from_=2, to=1000, width=6, textvariable=self.generate_width).grid(row=1, column=0, padx=3)
+        tk.Label(generator_frame, text="Height", **label_style).grid(row=0, column=1)
+        tk.Spinbox(generator_frame, from_=2, to=1000, width=6, textvariable=self.generate_height).grid(row=1, column=1, padx=3)
+        tk.Label(generator_frame, text="Seed", **label_style).grid(row=0, column=2)
+        tk.Entry(generator_frame, width=12, textvariable=self.generate_seed).grid(row=1, column=2, padx=3)
+        tk.Label(generator_frame, text="Type", **label_style).grid(row=0, column=3)
+        tk.OptionMenu(generator_frame, self.generate_algorithm, *randomMaze.GENERATORS).grid(row=1, column=3, padx=3)
         tk.Button(self, text="Play Mode", command=self.start_play_mode, **button_style).grid(row=2, column=4, padx=5, pady=5)
+        # Beam width, and whether a failed beam search retries with a wider beam
+        beam_frame = tk.Frame(self, bg="#2c3e50")
+        beam_frame.grid(row=2, column=2, padx=5, pady=5)
+        self.beam_width = tk.IntVar(value=2)
+        self.beam_widen = tk.BooleanVar(value=False)
+        tk.Label(beam_frame, text="Beam width", **label_style).grid(row=0, column=0)
+        tk.Spinbox(beam_frame, from_=1, to=100000, width=6, textvariable=self.beam_width).grid(row=1, column=0, padx=3)
+        tk.Checkbutton(
+            beam_frame,
+            text="Auto-widen",
+            variable=self.beam_widen,
+            selectcolor="#2c3e50",
+            activebackground="#2c3e50",
+            activeforeground="#ecf0f1",
+            **label_style,
+        ).grid(row=0, column=1, rowspan=2, padx=3)
+        # Profiling toggle; starts on when MAZE_PROFILE is set
+        self.profiling = tk.BooleanVar(value=mazeProfiler.enabled())
+        tk.Checkbutton(
+            self,
+            text="Profile",
+            variable=self.profiling,
+            command=self.toggle_profiling,
+            font=("Arial", 10),
+            fg="#ecf0f1",
+            bg="#2c3e50",
+            selectcolor="#2c3e50",
+            activebackground="#2c3e50",
+            activeforeground="#ecf0f1",
+        ).grid(row=3, column=2, padx=5, pady=5)
+        # Replay speed slider and skip button
+        self.replay_speed = tk.Scale(
+            self,
+            from_=1,
+            to=500,
+            orient=tk.HORIZONTAL,
+            label="Cells per frame",
+            font=("Arial", 10),
+            fg="#ecf0f1",
+            bg="#2c3e50",
+            highlightthickness=0,
+            length=250,
+        )
+        self.replay_speed.set(20)
+        self.replay_speed.grid(row=3, column=0, columnspan=2, padx=5, pady=5)
+        tk.Button(self, text="Skip to End", command=self.skip_replay, **button_style).grid(
+            row=4, column=0, padx=(5, 10), pady=10
+        )
+        # Hint button for play mode
+        tk.Button(self, text="Hint", command=self.show_hint, **button_style).grid(
+            row=4, column=1, padx=(5, 10), pady=10
+        )
+        # Export the stats of the last solve as JSON
+        tk.Button(self, text="Export Stats", command=self.export_stats, **button_style).grid(
+            row=4, column=2, padx=(5, 10), pady=10
+        )
         # Save Map button
         tk.Button(self, text="Save Map", command=self.save_map, **button_style).grid(
             row=4, column=3, padx=(5, 10), pady=10
@@ -375,6 +206,12 @@ class MazeApp(tk.Tk):
 
         # Draw the initial maze layout
         self.draw_maze()
+    def fit_window(self):
+        """Size the window around the maze canvas, capped for a 15-inch screen (approx 1440px width)."""
+        window_width = min(self.maze.width * self.cell_size, MAX_CANVAS_WIDTH) + 40
+        window_height = min(self.maze.height * self.cell_size, MAX_CANVAS_HEIGHT) + 320
+        self.center_window(window_width, window_height)
+
     def center_window(self, width, height):
         # Get the screen width and height
         screen_width = self.winfo_screenwidth()
@@ -391,10 +228,24 @@ class MazeApp(tk.Tk):
         algorithm = self.selected_algorithm.get()
         if algorithm == "Solve BFS":
             self.solve_maze_bfs()
+        elif algorithm == "Solve BFS (Wavefront)":
+            self.solve_maze_bfs_wavefront()
+        elif algorithm == "Solve Bidirectional BFS":
+            self.solve_maze_bidirectional_bfs()
         elif algorithm == "Solve DFS":
             self.solve_maze_dfs()
         elif algorithm == "Solve A*":
             self.solve_maze_a_star()
+        elif algorithm == "Solve A* (Optimal)":
+            self.solve_maze_a_star_optimal()
+        elif algorithm == "Solve A* (Exact)":
+            self.solve_maze_a_star_exact()
+        elif algorithm == "Solve Bidirectional A*":
+            self.solve_maze_bidirectional_a_star()
+        elif algorithm == "Solve Jump Point Search":
+            self.solve_maze_jump_point()
+        elif algorithm == "Solve Contracted Graph":
+            self.solve_maze_contracted()
         elif algorithm == "Solve Greedy":
             self.solve_maze_greedy()
         elif algorithm == "Solve Hill Climbing":
@@ -405,118 +256,265 @@ class MazeApp(tk.Tk):
             self.status_label.config(text="Please select a valid algorithm!")
         
     def generate_maze(self):
-        # Call randomMaze.py to generate a new maze
-        subprocess.run(["python", "randomMaze.py"])
-        self.maze = Maze("maze.txt")  # Reload the maze
+        """Generate a new maze in memory from the size, seed and type controls."""
+        try:
+            width, height = self.generate_width.get(), self.generate_height.get()
+            seed_text = self.generate_seed.get().strip()
+            seed = int(seed_text) if seed_text else random.randrange(2 ** 32)
+            maze = randomMaze.generate(width, height, seed, self.generate_algorithm.get())
+        except (tk.TclError, ValueError) as e:
+            self.status_label.config(text=f"Cannot generate maze: {e}")
+            return
+
+        self.maze = maze
+        self.fit_window()
         self.draw_maze()  # Refresh the maze display
-        self.status_label.config(text="New maze generated!")
+        self.status_label.config(text=f"New {width}x{height} maze generated (seed {seed})!")
 
     def draw_maze(self):
         """
         Draw the maze on the canvas with walls, empty spaces, start, and goal.
-        """
-        for row in range(self.maze.height):
-            for col in range(self.maze.width):
-                x1 = col * self.cell_size
-                y1 = row * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-
-                # Check what to draw
-                if self.maze.walls[row][col]:  # Wall
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="black", outline="white")
-                elif (row, col) == self.maze.start:  # Start (A)
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="red", outline="white")
-                elif (row, col) == self.maze.goal:  # Goal (B)
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="green", outline="white")
-                else:  # Empty space
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="white")
-        
 
-    def visualize(self, state):
-        row, col = state
-        x1, y1 = col * self.cell_size, row * self.cell_size
-        x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill="yellow", outline="yellow")
-        self.update()
-        self.after(10)
+        Mazes that fit on the canvas at ``cell_size`` get one rectangle per
+        cell; larger ones are painted into an image that can be zoomed with
+        the mouse wheel and panned by dragging or with the scrollbars.
+        """
+        with mazeProfiler.profiled(self.maze, "draw", "draw_maze"):
+            self.cancel_replay()
+            self.canvas.delete("all")
+            self.hint_path = None
+
+            maze_width = self.maze.width * self.cell_size
+            maze_height = self.maze.height * self.cell_size
+            self.canvas.config(width=min(maze_width, MAX_CANVAS_WIDTH), height=min(maze_height, MAX_CANVAS_HEIGHT))
+            if maze_width <= MAX_CANVAS_WIDTH and maze_height <= MAX_CANVAS_HEIGHT:
+                self.renderer = mazeRenderer.CellRenderer(self.canvas, self.maze, self.cell_size)
+                self.x_scrollbar.grid_remove()
+                self.y_scrollbar.grid_remove()
+            else:
+                self.renderer = mazeRenderer.ImageRenderer(self.canvas, self.maze)
+                self.renderer.xscroll = self.x_scrollbar.set
+                self.renderer.yscroll = self.y_scrollbar.set
+                self.renderer.on_view_change = self.redraw_markers
+                self.x_scrollbar.config(command=self.renderer.xview)
+                self.y_scrollbar.config(command=self.renderer.yview)
+                self.x_scrollbar.grid(row=1, column=0, sticky="ew")
+                self.y_scrollbar.grid(row=0, column=1, sticky="ns")
+            self.renderer.draw()
+
+            # Large mazes need more cells per frame to replay in reasonable time
+            self.replay_speed.config(to=max(500, self.maze.width * self.maze.height // 100))
 
     def draw_path(self, path):
-        for cell in path:
-            row, col = cell
-            x1, y1 = col * self.cell_size, row * self.cell_size
-            x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill="blue", outline="blue")
-            self.update()
-            self.after(10)
+        self.renderer.paint([self.maze.index(cell) for cell in path], mazeRenderer.PATH)
 
     def clear_cells(self):
         """
         Clears all non-wall cells and redraws the start (red) and goal (green) cells.
         """
-        for row in range(self.maze.height):
-            for col in range(self.maze.width):
-                if not self.maze.walls[row][col]:
-                    x1, y1 = col * self.cell_size, row * self.cell_size
-                    x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="white")
-
-        # Redraw the start (red) and goal (green) cells
-        self.draw_special_cells()
+        self.cancel_replay()
+        self.renderer.clear()
+        self.canvas.delete("hint", "player")
+        self.hint_path = None
 
         self.update()
 
-    def draw_special_cells(self):
-        """
-        Redraws the start and goal cells with their respective colors.
-        """
-        start_row, start_col = self.maze.start
-        goal_row, goal_col = self.maze.goal
-
-        # Draw start cell (red)
-        x1, y1 = start_col * self.cell_size, start_row * self.cell_size
-        x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill="red", outline="white")
+    def solve_maze_bfs(self):
+        self.clear_cells()
+        self.solve_maze(self.maze.bfs_solve, "BFS", "bfs")
 
-        # Draw goal cell (green)
-        x1, y1 = goal_col * self.cell_size, goal_row * self.cell_size
-        x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill="green", outline="white")
+    def solve_maze_bfs_wavefront(self):
+        self.clear_cells()
+        self.solve_maze(self.maze.bfs_wavefront_solve, "Wavefront BFS", "bfs-wavefront")
 
-    def solve_maze_bfs(self):
+    def solve_maze_bidirectional_bfs(self):
         self.clear_cells()
-        self.solve_maze(self.maze.bfs_solve, "BFS")
+        self.solve_maze(self.maze.bidirectional_bfs_solve, "Bidirectional BFS", "bfs-bidirectional")
 
     def solve_maze_dfs(self):
         self.clear_cells()
-        self.solve_maze(self.maze.dfs_solve, "DFS")
+        self.solve_maze(self.maze.dfs_solve, "DFS", "dfs")
 
     def solve_maze_a_star(self):
         self.clear_cells()
-        self.solve_maze(self.maze.a_star_solve, "A*")
+        self.solve_maze(self.maze.a_star_solve, "A*", "astar")
+
+    def solve_maze_a_star_optimal(self):
+        self.clear_cells()
+        self.solve_maze(self.maze.a_star_optimal_solve, "A* (Optimal)", "astar-optimal")
+
+    def solve_maze_a_star_exact(self):
+        self.clear_cells()
+        self.solve_maze(self.maze.a_star_exact_solve, "A* (Exact)", "astar-exact")
+
+    def solve_maze_bidirectional_a_star(self):
+        self.clear_cells()
+        self.solve_maze(self.maze.bidirectional_a_star_solve, "Bidirectional A*", "astar-bidirectional")
+
+    def solve_maze_jump_point(self):
+        self.clear_cells()
+        self.solve_maze(self.maze.jump_point_solve, "Jump Point Search", "jps")
+
+    def solve_maze_contracted(self):
+        self.clear_cells()
+        self.solve_maze(self.maze.contracted_solve, "Contracted Graph", "contracted")
 
     def solve_maze_greedy(self):
         self.clear_cells()
-        self.solve_maze(self.maze.greedy_solve, "Greedy")
+        self.solve_maze(self.maze.greedy_solve, "Greedy", "greedy")
     def solve_maze_hill_climb(self):
         self.clear_cells()
-        self.solve_maze(self.maze.hill_climb_solve, "Hill Climbing")
+        self.solve_maze(self.maze.hill_climb_solve, "Hill Climbing", "hillclimb")
 
     def solve_maze_beam_search(self):
+        try:
+            width = self.beam_width.get()
+        except tk.TclError as e:
+            self.status_label.config(text=f"Invalid beam width: {e}")
+            return
+        if width < 1:
+            self.status_label.config(text="Beam width must be at least 1")
+            return
+
+        params = {"beam_width": width}
+        widen = 2 if self.beam_widen.get() else 1
+        if widen > 1:
+            params["widen"] = widen
+
         self.clear_cells()
-        self.solve_maze(lambda visualize: self.maze.beam_search_solve(visualize, beam_width=2), "Beam Search")
+        self.solve_maze(
+            lambda: self.maze.beam_search_solve(beam_width=width, widen=widen),
+            f"Beam Search (width {width})",
+            "beam",
+            params,
+        )
 
-    def solve_maze(self, solve_method, method_name):
-        self.status_label.config(text=f"Solving with {method_name}...")
-        self.update()
-        try:
-            explored_path = solve_method(self.visualize)
-            self.draw_path(explored_path)
-            num_explored = self.maze.num_explored
-            steps_to_goal = len(explored_path)
-            self.status_label.config(text=f"Solving with {method_name}, Explored States: {num_explored}, Steps to Goal: {steps_to_goal}")
-        except Exception as e:
-            self.status_label.config(text=str(e))
+    def solve_maze(self, solve_method, method_name, algorithm, params=None):
+        """
+        Run a solver at full speed, then replay its recorded exploration on
+        the canvas. When this maze was already solved with the same algorithm
+        and parameters, the stored result is shown instantly instead.
+        """
+        with mazeProfiler.profiled(self.maze, algorithm, "solve_maze"):
+            cached = self.solve_cache.get(self.maze, algorithm, params)
+            if cached is not None:
+                stats = self.maze.stats = SolveStats.from_dict(cached["stats"])
+                self.maze.explored_order = cached["explored"]
+                if cached["path"] is None:
+                    status = f"{stats.error} (cached)"
+                else:
+                    self.maze.solution = (cached["actions"], cached["path"])
+                    status = f"Solved with {method_name} (cached), Explored States: {stats.expansions}, Steps to Goal: {stats.path_length}"
+                self.start_replay(cached["explored"], cached["path"], status, instant=True)
+                return
+
+            self.status_label.config(text=f"Solving with {method_name}...")
+            self.update()
+
+            try:
+                explored_path = solve_method()
+                num_explored = self.maze.num_explored
+                steps_to_goal = len(explored_path)
+                status = f"Solving with {method_name}, Explored States: {num_explored}, Steps to Goal: {steps_to_goal}"
+            except Exception as e:
+                explored_path = None
+                status = str(e)
+
+            stats = self.maze.stats
+            solution = self.maze.solution if explored_path is not None else None
+            self.solve_cache.put(self.maze, algorithm, params, {"explored": stats.expansions, **stats.to_dict()}, solution, self.maze.explored_order)
+            self.start_replay(self.maze.explored_order, explored_path, status, stats=stats)
+
+    def start_replay(self, explored, path, status, instant=False, stats=None):
+        """
+        Animate a recorded exploration (flat cell indices) with after()-scheduled
+        frames, painting as many cells per frame as the speed slider says, then
+        draw the path and show ``status`` with the maze's solve stats. Time
+        spent painting is added to ``stats`` as visualize time, when given.
+        """
+        self.cancel_replay()
+        self.replay = {"explored": explored, "path": path, "position": 0, "status": status, "stats": stats}
+        if instant:
+            self.skip_replay()
+        else:
+            self.replay_frame()
+
+    def replay_frame(self):
+        replay = self.replay
+        explored = replay["explored"]
+        end = min(replay["position"] + self.replay_speed.get(), len(explored))
+        self.paint_replay(explored[replay["position"]:end], mazeRenderer.EXPLORED)
+        replay["position"] = end
+
+        if end < len(explored):
+            self.status_label.config(text=f"Replaying: {end}/{len(explored)} explored states")
+            self.replay_job = self.after(FRAME_INTERVAL_MS, self.replay_frame)
+        else:
+            self.finish_replay()
+
+    def skip_replay(self):
+        """Paint whatever is left of the current replay at once."""
+        if self.replay is None:
+            return
+        if self.replay_job is not None:
+            self.after_cancel(self.replay_job)
+            self.replay_job = None
+
+        replay = self.replay
+        self.paint_replay(replay["explored"][replay["position"]:], mazeRenderer.EXPLORED)
+        replay["position"] = len(replay["explored"])
+        self.finish_replay()
+
+    def paint_replay(self, states, kind):
+        """Paint cells of the current replay, timing it into the replay's stats."""
+        started = time.perf_counter()
+        self.renderer.paint(states, kind)
+        stats = self.replay["stats"]
+        if stats is not None:
+            elapsed = time.perf_counter() - started
+            stats.visualize_time += elapsed
+            stats.wall_time += elapsed
+
+    def finish_replay(self):
+        replay = self.replay
+        if replay["path"] is not None:
+            self.paint_replay([self.maze.index(cell) for cell in replay["path"]], mazeRenderer.PATH)
+        self.replay = None
+        self.replay_job = None
+        self.status_label.config(text=f"{replay['status']}\n{self.maze.stats.summary()}")
+
+    def toggle_profiling(self):
+        """Switch cProfile dumps of every solve and redraw on or off."""
+        if self.profiling.get():
+            mazeProfiler.enable()
+            self.status_label.config(text=f"Profiling on: dumps go to '{mazeProfiler.profile_dir()}'")
+        else:
+            mazeProfiler.disable()
+            self.status_label.config(text="Profiling off")
+
+    def export_stats(self):
+        """Write the stats of the last solve to a JSON file."""
+        if self.maze.stats.algorithm is None:
+            self.status_label.config(text="Solve the maze first to export its stats!")
+            return
+        file_path = filedialog.asksaveasfilename(
+            title="Export Stats",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialfile=f"{self.maze.stats.algorithm}_stats.json",
+        )
+        if not file_path:
+            return
+        with open(file_path, "w") as f:
+            f.write(self.maze.stats.to_json(indent=2))
+        self.status_label.config(text=f"Stats exported to '{file_path}'")
+
+    def cancel_replay(self):
+        """Stop the current replay without finishing it."""
+        if self.replay_job is not None:
+            self.after_cancel(self.replay_job)
+        self.replay = None
+        self.replay_job = None
 
     def save_map(self):
         # Ensure the './save' directory exists
@@ -539,23 +537,11 @@ class MazeApp(tk.Tk):
             if not filename.endswith(".txt"):
                 filename += ".txt"
 
-        # Create map file content
-        map_content = []
-        for i in range(self.maze.height):
-            line = "".join(
-                "A" if (i, j) == self.maze.start else
-                "B" if (i, j) == self.maze.goal else
-                " " if not self.maze.walls[i][j] else "#"
-                for j in range(self.maze.width)
-            )
-            map_content.append(line)
-
         # Define the full path for the save file
         file_path = os.path.join(save_dir, filename)
 
         # Save the content to a file
-        with open(file_path, "w") as f:
-            f.write("\n".join(map_content))
+        randomMaze.save_maze_to_file(self.maze, file_path)
 
         # Update the status label to confirm the save
         self.status_label.config(text=f"Map saved as '{file_path}'")
@@ -582,6 +568,7 @@ class MazeApp(tk.Tk):
         self.bind("<Down>", self.move_down)
         self.bind("<Left>", self.move_left)
         self.bind("<Right>", self.move_right)
+        self.bind("<h>", self.show_hint)
 
         # Update the maze display to highlight the player's starting position
         self.update_player_position()
@@ -615,9 +602,11 @@ class MazeApp(tk.Tk):
         if (
             0 <= new_position[0] < self.maze.height
             and 0 <= new_position[1] < self.maze.width
-            and not self.maze.walls[new_position[0]][new_position[1]]
+            and not self.maze.is_wall(new_position)
         ):
             self.player_position = new_position
+            self.canvas.delete("hint")  # The previous hint no longer starts at the player
+            self.hint_path = None
             self.update_player_position()
 
             # Increment step count and update status label
@@ -632,19 +621,53 @@ class MazeApp(tk.Tk):
                 self.unbind("<Down>")
                 self.unbind("<Left>")
                 self.unbind("<Right>")
+                self.unbind("<h>")
+
+    def show_hint(self, event=None):
+        """Show how far the player is from the goal and draw the shortest way there."""
+        if not getattr(self, "play_mode_active", False):
+            self.status_label.config(text="Start Play Mode to get a hint!")
+            return
+
+        # Distances come from the maze's cached goal distance field, so hints are instant
+        distance = self.maze.distance_to_goal(self.player_position)
+        if distance is None:
+            self.status_label.config(text=f"No way to the goal from here! Steps: {self.steps_taken}")
+            return
+
+        self.hint_path = self.maze.path_from(self.player_position)[:-1]
+        self.draw_hint()
+        self.status_label.config(text=f"Hint: {distance} steps to the goal. Steps: {self.steps_taken}")
+
+    def draw_hint(self):
+        self.canvas.delete("hint")
+        for cell in self.hint_path:
+            x1, y1, x2, y2 = self.renderer.cell_bbox(cell)
+            inset = (x2 - x1) / 3
+            self.canvas.create_oval(
+                x1 + inset, y1 + inset, x2 - inset, y2 - inset,
+                fill="#3498db", outline="", tag="hint",
+            )
+        self.canvas.tag_raise("player")
 
     def update_player_position(self):
         """Update the player's position on the canvas."""
         self.canvas.delete("player")
-        row, col = self.player_position
-        x1, y1 = col * self.cell_size, row * self.cell_size
-        x2, y2 = x1 + self.cell_size, y1 + self.cell_size
+        x1, y1, x2, y2 = self.renderer.cell_bbox(self.player_position)
         self.canvas.create_oval(x1, y1, x2, y2, fill="green", tag="player")
 
+    def redraw_markers(self):
+        """Move the player and hint markers after the image renderer zoomed or scrolled."""
+        if self.hint_path:
+            self.draw_hint()
+        if self.canvas.find_withtag("player"):
+            self.update_player_position()
+
 
 
 
     def exit_to_start_screen(self):
+        self.cancel_replay()  # A queued replay frame would otherwise paint onto the destroyed canvas
         self.destroy()
         start_screen = startScreen.StartScreen()  # Reopen the start screen
         start_screen.mainloop()